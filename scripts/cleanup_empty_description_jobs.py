@@ -57,16 +57,16 @@ async def _find_candidates(repo: JobRepository, min_chars: int) -> list:
     """Cross-user sweep of cleanable rows with short descriptions.
 
     The repo's per-user query methods aren't suitable for an admin sweep, so we
-    query the underlying table directly (SQLite only — InMemoryJobRepository
-    isn't a meaningful target for backlog cleanup).
+    query the repo's engine-bound table directly (SQLite only —
+    InMemoryJobRepository isn't a meaningful target for backlog cleanup).
     """
-    from src.services.db.tables import Job
+    table = repo._job_table  # type: ignore[attr-defined]
 
     candidates = []
     for status in CLEANABLE_STATUSES:
         rows = (
-            await Job.select()
-            .where(Job.status == status.value)
+            await table.select()
+            .where(table.status == status.value)
             .run()
         )
         for row in rows:
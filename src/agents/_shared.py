@@ -10,14 +10,19 @@ to eliminate code duplication. Provides shared functions for:
 """
 
 import asyncio
-import json
 import logging
+import re
 import time
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 from src.services.cv.cv_composer import CVComposer
+from src.services.cv.cv_prompts import CVPromptManager
 from src.services.cv.cv_validator import CVValidator, HallucinationPolicy
-from src.services.cv.pdf_generator import PDFGenerator
+from src.services.cv.job_summary_cache import JobSummaryCache
+from src.services.cv.pdf_generator import get_pdf_generator
 from src.services.db.job_repository import JobRepository
 
 from ..config.settings import get_settings
@@ -27,6 +32,14 @@ from ..llm.providers.instructor_client import InstructorClient, litellm_model
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Filename sanitisation: keep word characters, spaces and hyphens (``\w`` is
+# the ``isalnum()`` rule plus "_", so non-ASCII names survive).
+_FILENAME_UNSAFE = re.compile(r"[^\w \-]+")
+
+# Shared across workflow runs so retries and re-surfaced postings reuse the
+# job analysis instead of paying for another LLM call.
+job_summary_cache = JobSummaryCache()
+
 
 def get_repository_from_config(config: dict) -> JobRepository:
     """Extract repository from LangGraph config['configurable'].
@@ -109,6 +122,11 @@ def create_llm_client(llm_provider: str | None = None, llm_model: str | None = N
 def load_master_cv() -> dict:
     """Load master CV from filesystem.
 
+    The file's bytes are cached per ``(path, mtime)``, so repeated loads of
+    an unchanged file skip the disk read; editing the file changes its mtime
+    and the next call re-reads it. Each call parses its own dict (orjson is
+    faster than deep-copying a cached one), so callers may mutate it freely.
+
     Returns:
         Master CV as a dictionary.
 
@@ -116,11 +134,31 @@ def load_master_cv() -> dict:
         FileNotFoundError: If master CV file does not exist.
     """
     cv_path = Path(settings.master_cv_path)
-    if not cv_path.exists():
-        raise FileNotFoundError(f"Master CV not found at {cv_path}")
+    try:
+        mtime_ns = cv_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Master CV not found at {cv_path}") from None
+
+    return orjson.loads(_read_master_cv(str(cv_path), mtime_ns))
+
 
-    with open(cv_path, encoding="utf-8") as f:
-        return json.load(f)
+@lru_cache(maxsize=4)
+def _read_master_cv(path: str, mtime_ns: int) -> bytes:
+    """Raw master CV at ``path``; ``mtime_ns`` only participates in the key."""
+    return Path(path).read_bytes()
+
+
+@lru_cache(maxsize=4)
+def get_cv_prompt_manager(prompts_dir: str) -> CVPromptManager:
+    """Return the process-wide, pre-warmed prompt manager for ``prompts_dir``.
+
+    Built on first use (or at API startup) so every CV composition reuses the
+    same cached templates instead of re-reading them from disk per job. With
+    ``DEBUG`` on, edited prompt files are picked up without a restart.
+    """
+    prompts = CVPromptManager(prompts_dir, auto_reload=settings.debug)
+    prompts.warm()
+    return prompts
 
 
 def _resolve_hallucination_policy() -> HallucinationPolicy:
@@ -171,7 +209,11 @@ async def compose_cv(
     try:
         llm_client = create_llm_client(llm_provider, llm_model)
 
-        cv_composer = CVComposer(llm_client=llm_client, prompts_dir=settings.prompts_dir)
+        cv_composer = CVComposer(
+            llm_client=llm_client,
+            summary_cache=job_summary_cache,
+            prompts=get_cv_prompt_manager(settings.prompts_dir),
+        )
 
         master_cv = state.get("master_cv")
         job_posting = state.get("job_posting")
@@ -217,6 +259,13 @@ async def compose_cv(
         }
 
 
+def _pdf_filename(candidate_name: str, company: str, job_title: str, suffix: str) -> str:
+    """``<name>_<company>_<title><suffix>.pdf`` with unsafe characters dropped
+    and each space turned into an underscore."""
+    parts = (_FILENAME_UNSAFE.sub("", p).strip() for p in (candidate_name, company, job_title))
+    return f"{'_'.join(parts)}{suffix}.pdf".replace(" ", "_")
+
+
 async def generate_pdf(
     state: dict,
     *,
@@ -255,17 +304,10 @@ async def generate_pdf(
         job_title = job_posting.get("title", "unknown")
         company = job_posting.get("company", "unknown")
 
-        # Generate safe filename components
-        safe_company = "".join(c for c in company if c.isalnum() or c in (" ", "-", "_")).strip()
-        safe_title = "".join(c for c in job_title if c.isalnum() or c in (" ", "-", "_")).strip()
         candidate_name = cv_json.get("contact", {}).get("full_name", "Unknown")
-        safe_name = "".join(
-            c for c in candidate_name if c.isalnum() or c in (" ", "-", "_")
-        ).strip()
 
-        # Build filename with per-user directory
-        suffix = version_suffix or ""
-        pdf_filename = f"{safe_name}_{safe_company}_{safe_title}{suffix}.pdf".replace(" ", "_")
+        # Build a safe filename with per-user directory
+        pdf_filename = _pdf_filename(candidate_name, company, job_title, version_suffix or "")
         user_id = state.get("user_id", "")
         if user_id:
             output_dir = Path(settings.generated_cvs_dir) / user_id
@@ -277,9 +319,12 @@ async def generate_pdf(
         # Resolve template name
         effective_template = template_name or settings.cv_template_name
 
-        # Initialize PDF generator
-        generator = PDFGenerator(
-            template_dir=settings.cv_template_dir, template_name=effective_template
+        # Shared per-template generator (template and stylesheet parsed once)
+        generator = get_pdf_generator(
+            settings.cv_template_dir,
+            effective_template,
+            auto_reload=settings.debug,
+            bytecode_cache_dir=settings.cv_template_cache_dir,
         )
 
         # Generate PDF (offload blocking WeasyPrint rendering to thread)
@@ -20,6 +20,7 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
+from src.services.jobs.filter_decision_cache import FilterDecisionCache
 from src.services.jobs.job_filter import JobFilter
 from src.services.jobs.job_fixtures import get_cached_llm_response, save_llm_response
 from src.services.jobs.job_source import JobExtractionError, JobSourceFactory
@@ -38,6 +39,10 @@ from ._shared import (
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Shared across workflow runs so re-surfaced postings and recovered jobs reuse
+# an earlier verdict instead of paying for another LLM call.
+filter_decision_cache = FilterDecisionCache()
+
 
 class PreparationWorkflowState(TypedDict):
     """State structure for Preparation Workflow."""
@@ -367,7 +372,7 @@ async def filter_job_node(
             filter_provider = user_model_prefs.job_filtering.provider
             filter_model = user_model_prefs.job_filtering.model
         llm_client = create_llm_client(filter_provider, filter_model)
-        job_filter = JobFilter(llm_client=llm_client)
+        job_filter = JobFilter(llm_client=llm_client, decision_cache=filter_decision_cache)
 
         job_posting = state.get("job_posting") or {}
 
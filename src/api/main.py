@@ -76,6 +76,25 @@ __all__ = [
 _get_ctx = get_ctx
 
 
+def _prewarm_cv_prompts(prompts_dir: object) -> None:
+    """Pre-warm the CV prompt templates so the first job after boot doesn't
+    pay for the disk reads.
+
+    Read-only and best-effort: skipped unless ``prompts_dir`` is an existing
+    directory (the loader would otherwise create it), and any failure is
+    logged — composition loads the templates lazily anyway.
+    """
+    if not isinstance(prompts_dir, str) or not Path(prompts_dir).is_dir():
+        logger.debug("Skipping CV prompt pre-warm: %r is not a directory", prompts_dir)
+        return
+    try:
+        from src.agents._shared import get_cv_prompt_manager
+
+        get_cv_prompt_manager(prompts_dir)
+    except Exception:
+        logger.warning("Failed to pre-warm CV prompt templates", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan: create AppContext, initialize, yield, cleanup."""
@@ -120,6 +139,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     ctx.create_background_task(_cleanup_magic_links_loop())
 
+    _prewarm_cv_prompts(settings.prompts_dir)
+
     # Load the dynamic model catalog (up-to-date model list + prices) without
     # blocking startup, and start its daily refresh. Best-effort — the static
     # MODEL_CATALOG remains the fallback when offline.
@@ -441,7 +441,7 @@ async def get_job_cv_html(
         if not status.cv_json:
             raise HTTPException(404, "CV JSON not found for this job")
 
-        from src.services.cv.pdf_generator import PDFGenerator
+        from src.services.cv.pdf_generator import get_pdf_generator
 
         template_name = "compact"
         thread_info = await ctx.get_workflow_thread(job_id)
@@ -456,7 +456,13 @@ async def get_job_cv_html(
             raw_input = state.get("raw_input", {})
             template_name = raw_input.get("template_name") or "compact"
 
-        generator = PDFGenerator(template_name=template_name)
+        settings = get_settings()
+        generator = get_pdf_generator(
+            settings.cv_template_dir,
+            template_name,
+            auto_reload=settings.debug,
+            bytecode_cache_dir=settings.cv_template_cache_dir,
+        )
         html = generator.render_html(status.cv_json)
 
         return HTMLResponse(content=html, media_type="text/html")
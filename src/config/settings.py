@@ -88,6 +88,7 @@ class Settings(BaseSettings):
     # -------------------------------------------------------------------------
     cv_template_dir: str = "src/templates/cv"
     cv_template_name: str = "compact"   # modern | compact | classic | minimal | profile-card
+    cv_template_cache_dir: str = "./data/.jinja_cache"  # compiled template bytecode
 
     # -------------------------------------------------------------------------
     # LinkedIn Search — global fallback (env-specific — set in .env)
@@ -29,8 +29,10 @@ from collections.abc import Callable
 from functools import lru_cache
 from typing import Any, TypeVar, overload
 
+import httpx
 import instructor
 import litellm
+import orjson
 from pydantic import BaseModel, create_model
 
 from ..base import BaseLLMClient, LLMProvider
@@ -43,6 +45,16 @@ _ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel)
 litellm.drop_params = True
 litellm.telemetry = False
 
+# One keep-alive connection pool for every LLM call in the process. Clients are
+# built per workflow node (``create_llm_client``), so without a shared session
+# the OpenAI-compatible routes can pay a fresh TCP + TLS handshake per call.
+# The generous read timeout matches LiteLLM's own default for long generations.
+_HTTP_CLIENT = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    timeout=httpx.Timeout(600.0, connect=10.0),
+)
+litellm.client_session = _HTTP_CLIENT
+
 logger = logging.getLogger(__name__)
 
 #: Maps our provider enum onto the LiteLLM route prefix. The inverse of
@@ -354,16 +366,12 @@ def _model_from_schema(schema: dict) -> type[BaseModel]:
     Supports the flat/nested object subset our call sites emit. Cached on the
     schema's identity via its JSON string so repeated calls reuse one class.
     """
-    import json
-
-    return _model_from_schema_cached(json.dumps(schema, sort_keys=True))
+    return _model_from_schema_cached(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
 
 
 @lru_cache(maxsize=64)
-def _model_from_schema_cached(schema_json: str) -> type[BaseModel]:
-    import json
-
-    schema = json.loads(schema_json)
+def _model_from_schema_cached(schema_json: bytes) -> type[BaseModel]:
+    schema = orjson.loads(schema_json)
     return _build_model(schema, name="DynamicResponse")
 
 
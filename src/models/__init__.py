@@ -8,6 +8,7 @@ from .unified import (
     HITLDecisionResponse,
     JobDescriptionInput,
     JobRecord,
+    JobRecordSummary,
     JobStatusResponse,
     JobSubmitRequest,
     JobSubmitResponse,
@@ -26,6 +27,7 @@ __all__ = [
     "HITLDecisionResponse",
     "PendingApproval",
     "JobRecord",
+    "JobRecordSummary",
     "JobStatusResponse",
     "ApplicationHistoryItem",
     # CV models
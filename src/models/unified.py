@@ -183,6 +183,39 @@ class JobRecord(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
 
 
+class JobRecordSummary(BaseModel):
+    """Light projection of a JobRecord for list views.
+
+    Carries the scalar columns plus the posting's title/company, so listing
+    jobs does not move the JSON blobs (posting, CV, filter result) out of the
+    database.
+    """
+    job_id: str
+    user_id: str = ""
+    source: Literal["url", "manual", "linkedin"]
+    status: BusinessState
+    job_title: str | None = None
+    company: str | None = None
+    application_url: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_record(cls, job: JobRecord) -> "JobRecordSummary":
+        posting = job.job_posting or {}
+        return cls(
+            job_id=job.job_id,
+            user_id=job.user_id,
+            source=job.source,
+            status=job.status,
+            job_title=posting.get("title"),
+            company=posting.get("company"),
+            application_url=job.application_url,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
+
+
 # =============================================================================
 # API Response Models
 # =============================================================================
@@ -1,8 +1,8 @@
 """CV composition, validation, and PDF generation services.
 
-Note: PDFGenerator is NOT re-exported here because it eagerly imports
-WeasyPrint (heavy C library). Import it directly:
-    from src.services.cv.pdf_generator import PDFGenerator
+Note: PDFGenerator is NOT re-exported here; it is the one service backed by
+WeasyPrint (heavy C library, loaded on first render). Import it directly:
+    from src.services.cv.pdf_generator import PDFGenerator, get_pdf_generator
 """
 
 from .cv_composer import CVComposer, CVCompositionError
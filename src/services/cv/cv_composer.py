@@ -7,20 +7,26 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from pydantic import TypeAdapter
+
 from src.config.settings import Settings
 from src.llm.provider import BaseLLMClient
 from src.models.cv import (
     CVLLMOutput,
     JobSummary,
+    Language,
 )
 
 from .cv_prompts import CVPromptManager
 
 if TYPE_CHECKING:
     from .cv_validator import CVValidator
+    from .job_summary_cache import JobSummaryCache
 
 logger = logging.getLogger(__name__)
 
+_LANGUAGES_ADAPTER = TypeAdapter(list[Language])
+
 
 class CVCompositionError(Exception):
     """Raised when CV composition fails"""
@@ -54,6 +60,8 @@ class CVComposer:
         llm_client: BaseLLMClient,
         prompts_dir: str | None = None,
         settings: Settings | CVComposerSettings | None = None,
+        summary_cache: JobSummaryCache | None = None,
+        prompts: CVPromptManager | None = None,
     ):
         """
         Initialize CV Composer
@@ -62,10 +70,15 @@ class CVComposer:
             llm_client: LLM client for generation
             prompts_dir: Optional custom prompts directory
             settings: Optional settings instance (defaults to CVComposerSettings)
+            summary_cache: Optional shared cache of job summaries; when None,
+                every call to _summarize_job hits the LLM
+            prompts: Optional pre-warmed prompt manager to share across
+                composers; takes precedence over prompts_dir
         """
         self.llm = llm_client
-        self.prompts = CVPromptManager(prompts_dir)
+        self.prompts = prompts or CVPromptManager(prompts_dir)
         self.settings = settings or CVComposerSettings()
+        self.summary_cache = summary_cache
 
     def compose_cv(
         self,
@@ -97,11 +110,18 @@ class CVComposer:
 
         # Step 1: Analyze job description to extract requirements
         job_summary = self._summarize_job(job_posting, user_id=user_id)
+        # Serialized once for this composition; local, so concurrent
+        # compositions sharing the prompt manager never see each other's.
+        job_summary_json = self.prompts.serialize_job_summary(job_summary)
         logger.debug("Job analysis completed")
 
         # Step 2: Generate all CV sections in a single LLM call (optimized)
         generated_sections = self._compose_all_sections(
-            master_cv, job_summary, user_feedback, user_id=user_id
+            master_cv,
+            job_summary,
+            user_feedback,
+            user_id=user_id,
+            job_summary_json=job_summary_json,
         )
 
         # Step 2.5: Apply length limits to ensure 2-page target
@@ -176,6 +196,14 @@ Requirements:
 {job_posting.get("requirements", "")}
         """.strip()
 
+        cache_key = None
+        if self.summary_cache is not None:
+            cache_key = self.summary_cache.make_key(self.llm.model, job_description)
+            cached = self.summary_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Job summary served from cache")
+                return cached
+
         # Cache-aware spec: static instructions in system, JD in user.
         spec = self.prompts.get_job_summary_spec(
             job_description=job_description,
@@ -198,7 +226,10 @@ Requirements:
             logger.error(f"Failed to analyze job description: {e}")
             raise CVCompositionError(f"Job analysis failed: {e}") from e
 
-        return job_summary.model_dump()
+        summary = job_summary.model_dump()
+        if cache_key is not None:
+            self.summary_cache.put(cache_key, summary)
+        return summary
 
     def _compose_all_sections(
         self,
@@ -207,6 +238,7 @@ Requirements:
         user_feedback: str | None = None,
         *,
         user_id: str = "",
+        job_summary_json: str | None = None,
     ) -> dict[str, Any]:
         """
         Generate complete tailored CV in a single LLM call.
@@ -215,6 +247,7 @@ Requirements:
             master_cv: Complete master CV data
             job_summary: Structured job requirements from _summarize_job()
             user_feedback: Optional user feedback for retry/refinement
+            job_summary_json: ``job_summary`` pre-serialized by the caller
 
         Returns:
             Dictionary containing all tailored CV sections
@@ -231,6 +264,7 @@ Requirements:
             job_summary=job_summary,
             user_feedback=user_feedback,
             cache_key=f"cv_compose:{user_id}" if user_id else "",
+            job_summary_json=job_summary_json,
         )
 
         # Generate complete tailored CV (validated into a CVLLMOutput by the
@@ -334,18 +368,16 @@ Requirements:
         from src.models.cv import ContactInfo
 
         try:
-            contact = ContactInfo(**contact_data)
+            contact = ContactInfo.model_validate(contact_data)
             return contact.model_dump()
         except Exception as e:
             logger.error(f"Invalid contact information in master CV: {e}")
             raise CVCompositionError(f"Invalid contact data: {e}") from e
 
     def _validate_languages(self, languages_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        from src.models.cv import Language
-
         try:
-            languages = [Language(**lang) for lang in languages_data]
-            return [lang.model_dump() for lang in languages]
+            languages = _LANGUAGES_ADAPTER.validate_python(languages_data)
+            return _LANGUAGES_ADAPTER.dump_python(languages)
         except Exception as e:
             logger.error(f"Invalid languages in master CV: {e}")
             raise CVCompositionError(f"Invalid languages data: {e}") from e
@@ -357,7 +389,7 @@ Requirements:
             return None
 
         try:
-            interests = Interests(**interests_data)
+            interests = Interests.model_validate(interests_data)
             return interests.model_dump()
         except Exception as e:
             logger.error(f"Invalid interests in master CV: {e}")
@@ -370,7 +402,7 @@ Requirements:
         logger.debug("Validating tailored CV output")
 
         try:
-            validated = CVLLMOutput(**tailored_cv)
+            validated = CVLLMOutput.model_validate(tailored_cv)
         except Exception as e:
             logger.error(f"Schema validation failed: {e}")
             raise CVCompositionError(f"Tailored CV does not match expected schema: {e}") from e
@@ -1,14 +1,79 @@
 """Prompt management for CV composition"""
 
 import logging
+import os
+import re
+import shutil
+import warnings
 from pathlib import Path
-from string import Template
+
+import orjson
 
 from src.llm.prompt_spec import PromptSpec
 
 logger = logging.getLogger(__name__)
 
 
+# ``$$`` escape, ``${name}`` or ``$name`` — the placeholder grammar of
+# ``string.Template``, compiled once for every template.
+_VAR_RE = re.compile(
+    r"\$(?:(\$)|\{([_a-z][_a-z0-9]*)\}|([_a-z][_a-z0-9]*))", re.IGNORECASE | re.ASCII
+)
+
+# A parsed template: literal strings interleaved with (name, raw placeholder)
+# pairs. The raw text is emitted when the name has no value.
+_Segments = tuple[str | tuple[str, str], ...]
+
+
+def _split_template(template: str) -> _Segments:
+    """Parse ``template`` once into literal text and placeholders (``$$`` is
+    folded into the surrounding literal as ``$``)."""
+    segments: list[str | tuple[str, str]] = []
+    literal: list[str] = []
+    pos = 0
+    for match in _VAR_RE.finditer(template):
+        literal.append(template[pos : match.start()])
+        pos = match.end()
+        if match.group(1):
+            literal.append("$")
+            continue
+        segments.append("".join(literal))
+        literal = []
+        segments.append((match.group(2) or match.group(3), match.group(0)))
+    literal.append(template[pos:])
+    segments.append("".join(literal))
+    return tuple(segments)
+
+
+def _render_segments(segments: _Segments, mapping: dict) -> str:
+    """Fill a parsed template with a single ``str.join`` — no regex scan."""
+    return "".join(
+        seg
+        if seg.__class__ is str
+        else (str(mapping[seg[0]]) if seg[0] in mapping else seg[1])
+        for seg in segments
+    )
+
+
+def _fast_substitute(template: str, mapping: dict) -> str:
+    """``Template(template).safe_substitute(mapping)`` without the Template.
+
+    Unknown placeholders are left as-is; ``$$`` collapses to ``$``.
+    """
+    return _render_segments(_split_template(template), mapping)
+
+
+def _dumps_indented(obj) -> str:
+    """Pretty-print ``obj`` as JSON with a 2-space indent, via orjson's C
+    serializer.
+
+    The layout matches ``json.dumps(obj, indent=2)``, but non-ASCII text is
+    written as raw UTF-8 (like ``ensure_ascii=False``) rather than as
+    ``\\uXXXX`` escapes, so e.g. "Zoë" reaches the prompt as typed.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
 CV_EXTRACTION_PROMPT = """You are extracting a structured résumé from a PDF document.
 
 Read the attached PDF and produce a JSON object matching the CV schema you have been instructed to follow.
@@ -29,15 +94,22 @@ Rules:
 class PromptLoader:
     """Loads and manages prompts from external files"""
 
-    def __init__(self, prompts_dir: str | Path = "prompts/cv_composer"):
+    def __init__(self, prompts_dir: str | Path = "prompts/cv_composer", auto_reload: bool = False):
         """
         Initialize prompt loader
 
         Args:
             prompts_dir: Directory containing prompt files
+            auto_reload: Re-read a cached prompt when its file's mtime changes
+                         (one stat per cache hit; meant for development)
         """
         self.prompts_dir = Path(prompts_dir)
+        self.auto_reload = auto_reload
         self._cache: dict[str, str] = {}
+        # _cache key -> (text, parsed segments); re-parsed when the text changes
+        self._segments: dict[str, tuple[str, _Segments]] = {}
+        # _cache key -> st_mtime_ns at read time (only tracked with auto_reload)
+        self._mtimes: dict[str, int] = {}
         self._ensure_prompts_exist()
 
     def _ensure_prompts_exist(self):
@@ -48,12 +120,16 @@ class PromptLoader:
 
         # Copy example prompts if user prompts don't exist
         examples_dir = self.prompts_dir / "examples"
-        if examples_dir.exists():
-            for example_file in examples_dir.glob("*.txt"):
-                target_file = self.prompts_dir / example_file.name
-                if not target_file.exists():
-                    target_file.write_text(example_file.read_text(encoding="utf-8"))
-                    logger.info(f"Copied example prompt: {example_file.name}")
+        if examples_dir.is_dir():
+            with os.scandir(examples_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.endswith(".txt") and entry.is_file()):
+                        continue
+                    target_file = self.prompts_dir / entry.name
+                    if not target_file.exists():
+                        # Byte-level copy (sendfile on Linux): no decode/encode.
+                        shutil.copyfile(entry.path, target_file)
+                        logger.info(f"Copied example prompt: {entry.name}")
 
     def load(self, prompt_name: str, use_cache: bool = True) -> str:
         """
@@ -69,22 +145,43 @@ class PromptLoader:
         Raises:
             FileNotFoundError: If prompt file doesn't exist
         """
-        if use_cache and prompt_name in self._cache:
-            return self._cache[prompt_name]
-
         prompt_file = self.prompts_dir / f"{prompt_name}.txt"
 
+        if (
+            use_cache
+            and prompt_name in self._cache
+            and not self._is_stale(prompt_name, prompt_file)
+        ):
+            return self._cache[prompt_name]
+
         if not prompt_file.exists():
             raise FileNotFoundError(
                 f"Prompt file not found: {prompt_file}\nAvailable prompts: {self.list_available()}"
             )
 
-        prompt_content = prompt_file.read_text(encoding="utf-8")
-        self._cache[prompt_name] = prompt_content
+        prompt_content = self._read_and_cache(prompt_name, prompt_file)
 
         logger.debug(f"Loaded prompt: {prompt_name}")
         return prompt_content
 
+    def preload(self, prompt_names: list[str] | tuple[str, ...]) -> int:
+        """Read every file behind ``prompt_names`` into the cache in one pass.
+
+        Covers both layouts: ``<name>.txt`` (``load``/``get_template``) and
+        ``<name>.system.txt`` + ``<name>.user.txt`` (``load_spec``). Files
+        that do not exist are skipped.
+
+        Returns:
+            Number of files now cached.
+        """
+        loaded = 0
+        for name in prompt_names:
+            for stem in (name, f"{name}.system", f"{name}.user"):
+                if (self.prompts_dir / f"{stem}.txt").is_file():
+                    self.load(stem)
+                    loaded += 1
+        return loaded
+
     def reload(self, prompt_name: str | None = None):
         """
         Reload prompts from disk (useful for hot-reload during development)
@@ -94,14 +191,21 @@ class PromptLoader:
         """
         if prompt_name:
             self._cache.pop(prompt_name, None)
+            self._segments.pop(prompt_name, None)
+            self._mtimes.pop(prompt_name, None)
             logger.info(f"Reloaded prompt: {prompt_name}")
         else:
             self._cache.clear()
+            self._segments.clear()
+            self._mtimes.clear()
             logger.info("Reloaded all prompts")
 
     def list_available(self) -> list[str]:
         """List all available prompt names"""
-        return [f.stem for f in self.prompts_dir.glob("*.txt") if f.is_file()]
+        # DirEntry.is_file() is answered from readdir on most platforms — no
+        # per-file stat() as with Path.glob + Path.is_file.
+        with os.scandir(self.prompts_dir) as entries:
+            return [e.name[:-4] for e in entries if e.name.endswith(".txt") and e.is_file()]
 
     def get_template(self, prompt_name: str, **kwargs) -> str:
         """
@@ -114,14 +218,7 @@ class PromptLoader:
         Returns:
             Formatted prompt string
         """
-        prompt = self.load(prompt_name)
-        template = Template(prompt)
-
-        try:
-            return template.safe_substitute(**kwargs)
-        except KeyError as e:
-            logger.error(f"Missing template variable in {prompt_name}: {e}")
-            raise
+        return self._render(prompt_name, self.load(prompt_name), kwargs)
 
     def load_spec(
         self,
@@ -136,42 +233,97 @@ class PromptLoader:
 
         Returns a ``PromptSpec`` ready to hand to ``BaseLLMClient.generate_json``.
         """
-        system_template = self._read_file(f"{prompt_name}.system.txt")
-        user_template = self._read_file(f"{prompt_name}.user.txt")
-
-        try:
-            system = Template(system_template).safe_substitute(**(system_vars or {}))
-            user = Template(user_template).safe_substitute(**(user_vars or {}))
-        except KeyError as e:
-            logger.error(f"Missing template variable in {prompt_name} spec: {e}")
-            raise
+        system_name = f"{prompt_name}.system"
+        user_name = f"{prompt_name}.user"
+        system = self._render(system_name, self.load(system_name), system_vars or {})
+        user = self._render(user_name, self.load(user_name), user_vars or {})
 
         return PromptSpec(system=system, user=user, cache_key=cache_key)
 
-    def _read_file(self, filename: str) -> str:
-        path = self.prompts_dir / filename
-        if filename in self._cache:
-            return self._cache[filename]
-        if not path.exists():
-            raise FileNotFoundError(
-                f"Prompt file not found: {path}\nAvailable prompts: {self.list_available()}"
-            )
+    def _render(self, key: str, text: str, mapping: dict) -> str:
+        """Substitute ``mapping`` into ``text`` using the segments parsed for
+        ``key`` (parsed on first use and again whenever ``text`` is re-read)."""
+        cached = self._segments.get(key)
+        if cached is None or cached[0] is not text:
+            cached = (text, _split_template(text))
+            self._segments[key] = cached
+        return _render_segments(cached[1], mapping)
+
+    def _read_and_cache(self, key: str, path: Path) -> str:
+        if self.auto_reload:
+            # Stat before reading: an edit landing mid-read is caught next time.
+            self._mtimes[key] = path.stat().st_mtime_ns
         content = path.read_text(encoding="utf-8")
-        self._cache[filename] = content
+        self._cache[key] = content
         return content
 
+    def _is_stale(self, key: str, path: Path) -> bool:
+        """With ``auto_reload``, whether ``path`` changed since it was cached.
+
+        Always False otherwise, so production cache hits never touch disk.
+        """
+        if not self.auto_reload:
+            return False
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return True
+        if mtime_ns != self._mtimes.get(key):
+            logger.info(f"Prompt changed on disk, reloading: {key}")
+            return True
+        return False
+
 
 class CVPromptManager:
     """High-level prompt management for CV composition"""
 
-    def __init__(self, prompts_dir: str | Path | None = None):
+    # Split (system/user) templates behind the get_*_spec methods.
+    SPEC_PROMPTS = ("job_summary", "full_cv")
+    # Single-file templates behind the deprecated per-section get_*_prompt
+    # methods (superseded by the single full_cv call).
+    SECTION_PROMPTS = ("summary", "experience", "education", "skills", "projects", "certifications")
+
+    def __init__(self, prompts_dir: str | Path | None = None, auto_reload: bool = False):
         """
         Initialize CV prompt manager
 
         Args:
             prompts_dir: Custom prompts directory (defaults to prompts/cv_composer)
+            auto_reload: Pick up edited prompt files without ``reload()``
         """
-        self.loader = PromptLoader(prompts_dir or "prompts/cv_composer")
+        self.loader = PromptLoader(prompts_dir or "prompts/cv_composer", auto_reload=auto_reload)
+
+    def warm(self) -> None:
+        """Make sure every template this manager serves is cached, and that
+        the spec templates the composition pipeline needs exist.
+
+        Raises:
+            FileNotFoundError: If a ``SPEC_PROMPTS`` file is missing. Section
+                templates are optional and skipped when absent.
+        """
+        for name in self.SPEC_PROMPTS:
+            self.loader.load(f"{name}.system")
+            self.loader.load(f"{name}.user")
+        loaded = 2 * len(self.SPEC_PROMPTS) + self.loader.preload(self.SECTION_PROMPTS)
+        logger.info(f"Warmed {loaded} CV prompt templates from {self.loader.prompts_dir}")
+
+    @staticmethod
+    def serialize_job_summary(job_summary: dict) -> str:
+        """Serialize ``job_summary`` the way the prompt templates embed it.
+
+        Callers building several prompts for one composition serialize once
+        and pass the result as ``job_summary_json``.
+        """
+        return _dumps_indented(job_summary)
+
+    @staticmethod
+    def _warn_section_prompt(method: str) -> None:
+        warnings.warn(
+            f"CVPromptManager.{method} is deprecated: CVComposer generates every "
+            "section in one structured call via get_full_cv_spec.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
 
     def get_job_summary_spec(
         self, *, job_description: str, cache_key: str
@@ -196,65 +348,59 @@ class CVPromptManager:
         job_summary: dict,
     ) -> str:
         """Get prompt for professional summary generation"""
-        import json
-
+        self._warn_section_prompt("get_summary_prompt")
         return self.loader.get_template(
             "summary",
             current_role=current_role,
             years_experience=years_experience,
             key_skills=", ".join(key_skills),
             achievements="\n".join(f"- {a}" for a in achievements),
-            job_summary=json.dumps(job_summary, indent=2),
+            job_summary=_dumps_indented(job_summary),
         )
 
     def get_experience_prompt(self, experiences: list[dict], job_summary: dict) -> str:
         """Get prompt for experience section tailoring"""
-        import json
-
+        self._warn_section_prompt("get_experience_prompt")
         return self.loader.get_template(
             "experience",
-            experiences=json.dumps(experiences, indent=2),
-            job_summary=json.dumps(job_summary, indent=2),
+            experiences=_dumps_indented(experiences),
+            job_summary=_dumps_indented(job_summary),
         )
 
     def get_education_prompt(self, education: list[dict], job_summary: dict) -> str:
         """Get prompt for education section"""
-        import json
-
+        self._warn_section_prompt("get_education_prompt")
         return self.loader.get_template(
             "education",
-            education=json.dumps(education, indent=2),
-            job_summary=json.dumps(job_summary, indent=2),
+            education=_dumps_indented(education),
+            job_summary=_dumps_indented(job_summary),
         )
 
     def get_skills_prompt(self, skills: list[dict], job_summary: dict) -> str:
         """Get prompt for skills optimization"""
-        import json
-
+        self._warn_section_prompt("get_skills_prompt")
         return self.loader.get_template(
             "skills",
-            skills=json.dumps(skills, indent=2),
-            job_summary=json.dumps(job_summary, indent=2),
+            skills=_dumps_indented(skills),
+            job_summary=_dumps_indented(job_summary),
         )
 
     def get_projects_prompt(self, projects: list[dict], job_summary: dict) -> str:
         """Get prompt for projects highlighting"""
-        import json
-
+        self._warn_section_prompt("get_projects_prompt")
         return self.loader.get_template(
             "projects",
-            projects=json.dumps(projects, indent=2),
-            job_summary=json.dumps(job_summary, indent=2),
+            projects=_dumps_indented(projects),
+            job_summary=_dumps_indented(job_summary),
         )
 
     def get_certifications_prompt(self, certifications: list[str], job_summary: dict) -> str:
         """Get prompt for certifications display"""
-        import json
-
+        self._warn_section_prompt("get_certifications_prompt")
         return self.loader.get_template(
             "certifications",
-            certifications=json.dumps(certifications, indent=2),
-            job_summary=json.dumps(job_summary, indent=2),
+            certifications=_dumps_indented(certifications),
+            job_summary=_dumps_indented(job_summary),
         )
 
     def get_full_cv_spec(
@@ -264,14 +410,15 @@ class CVPromptManager:
         job_summary: dict,
         user_feedback: str | None = None,
         cache_key: str,
+        job_summary_json: str | None = None,
     ) -> PromptSpec:
         """Cache-aware spec for full CV composition.
 
         Static block (cached per user): instructions + JSON output schema +
         master CV. Variable block: job_summary + optional user_feedback section.
+        ``job_summary_json`` is ``job_summary`` already passed through
+        ``serialize_job_summary``; it is serialized here when omitted.
         """
-        import json
-
         user_feedback_section = ""
         if user_feedback:
             user_feedback_section = (
@@ -284,9 +431,13 @@ class CVPromptManager:
         return self.loader.load_spec(
             "full_cv",
             cache_key=cache_key,
-            system_vars={"master_cv": json.dumps(master_cv, indent=2)},
+            system_vars={"master_cv": _dumps_indented(master_cv)},
             user_vars={
-                "job_summary": json.dumps(job_summary, indent=2),
+                "job_summary": (
+                    job_summary_json
+                    if job_summary_json is not None
+                    else _dumps_indented(job_summary)
+                ),
                 "user_feedback_section": user_feedback_section,
             },
         )
@@ -10,6 +10,8 @@ import logging
 from enum import StrEnum
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from src.models.cv import (
     ContactInfo,
     CVLLMOutput,
@@ -21,6 +23,10 @@ from .cv_composer import CVCompositionError
 
 logger = logging.getLogger(__name__)
 
+# Validates/dumps the whole languages list in one pydantic-core pass instead of
+# one model instantiation per entry. Built once at import.
+_LANGUAGES_ADAPTER = TypeAdapter(list[Language])
+
 
 class HallucinationPolicy(StrEnum):
     """Policy for handling detected hallucinations in tailored CVs."""
@@ -83,7 +89,7 @@ class CVValidator:
             CVCompositionError: If contact data is invalid.
         """
         try:
-            contact = ContactInfo(**contact_data)
+            contact = ContactInfo.model_validate(contact_data)
             return contact.model_dump()
         except Exception as e:
             logger.error(f"Invalid contact information in master CV: {e}")
@@ -102,8 +108,8 @@ class CVValidator:
             CVCompositionError: If languages data is invalid.
         """
         try:
-            languages = [Language(**lang) for lang in languages_data]
-            return [lang.model_dump() for lang in languages]
+            languages = _LANGUAGES_ADAPTER.validate_python(languages_data)
+            return _LANGUAGES_ADAPTER.dump_python(languages)
         except Exception as e:
             logger.error(f"Invalid languages in master CV: {e}")
             raise CVCompositionError(f"Invalid languages data: {e}") from e
@@ -124,7 +130,7 @@ class CVValidator:
             return None
 
         try:
-            interests = Interests(**interests_data)
+            interests = Interests.model_validate(interests_data)
             return interests.model_dump()
         except Exception as e:
             logger.error(f"Invalid interests in master CV: {e}")
@@ -151,7 +157,7 @@ class CVValidator:
 
         # Schema validation via Pydantic
         try:
-            validated = CVLLMOutput(**tailored_cv)
+            validated = CVLLMOutput.model_validate(tailored_cv)
         except Exception as e:
             logger.error(f"Schema validation failed: {e}")
             raise CVCompositionError(f"Tailored CV does not match expected schema: {e}") from e
@@ -0,0 +1,74 @@
+"""In-process cache for LLM job summaries.
+
+The job-summary call is a pure function of the posting text and the model
+that analyses it, yet the same posting is summarised repeatedly: every HITL
+retry re-runs ``CVComposer._summarize_job`` on an unchanged job, and LinkedIn
+re-surfaces identical postings under different job ids. Keys are built from a
+normalised form of the description (whitespace collapsed, case-folded) so
+incidental formatting differences between scrapes still hit.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Collapse whitespace runs and case-fold so cosmetic diffs share a key."""
+    return _WHITESPACE.sub(" ", job_description).strip().casefold()
+
+
+class JobSummaryCache:
+    """Bounded, thread-safe LRU of ``job_summary`` dicts.
+
+    ``CVComposer.compose_cv`` runs inside ``asyncio.to_thread``, so lookups can
+    race across worker threads — hence the lock. Values are deep-copied on the
+    way in and out so callers may mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, job_description: str) -> str:
+        """Return the cache key for ``job_description`` summarised by ``model``."""
+        normalized = normalize_job_description(job_description)
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{model}:{digest}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(summary)
+
+    def put(self, key: str, summary: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = copy.deepcopy(summary)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
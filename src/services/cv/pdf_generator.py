@@ -1,27 +1,146 @@
-"""Service for generating PDF from CV JSON using WeasyPrint and Jinja2"""
+"""Service for generating PDF from CV JSON using WeasyPrint and Jinja2
 
+WeasyPrint is imported on first render rather than at module import: it
+dlopens cairo, pango and fontconfig, which modules that merely import this
+one (the workflows, the API routes, tests) should not pay for.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
 import logging
-from datetime import date
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, BinaryIO
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import CSS, HTML
-from weasyprint.text.fonts import FontConfiguration
+import orjson
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+if TYPE_CHECKING:
+    from weasyprint import CSS
+    from weasyprint.document import Document
+    from weasyprint.text.fonts import FontConfiguration
 
 logger = logging.getLogger(__name__)
 
 
+# English month abbreviations, independent of the process locale (strftime's
+# %b follows LC_TIME, which would localise resumes rendered on other hosts).
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_PRESENT = frozenset({"", "present", "current"})
+
+
+@lru_cache(maxsize=512)
+def _format_date_str(date_value: str) -> str:
+    """String branch of ``PDFGenerator._format_date``.
+
+    Memoized: the same few dates (and "Present") recur across entries and
+    across resumes, so parsing runs once per distinct string.
+    """
+    if date_value.lower() in _PRESENT:
+        return "Present"
+    try:
+        return _format_date_obj(date.fromisoformat(date_value))
+    except ValueError:
+        return date_value
+
+
+# Standalone previews remembered per generator (render_html)
+_HTML_CACHE_SIZE = 64
+
+# Browser-preview wrapper for render_html. The title is user data and is
+# autoescaped; the CSS and CV body are already trusted markup.
+_STANDALONE_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }} - Resume</title>
+    <style>
+{{ css | safe }}
+    </style>
+</head>
+<body>
+{{ body | safe }}
+</body>
+</html>"""
+
+
+@lru_cache(maxsize=16)
+def _read_css(path: str, mtime_ns: int) -> str:
+    """Stylesheet text shared by every generator in the process.
+
+    Keyed on the file's mtime so an edited stylesheet is picked up without a
+    restart; stale entries simply age out of the LRU.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    logger.debug(f"Cached CSS from {path}")
+    return text
+
+
+_NO_CONTACT: Mapping[str, str] = MappingProxyType({})
+
+
+def _full_name(cv_json: dict, default: str) -> str:
+    """Candidate name from ``cv_json``, tolerating a missing or null contact."""
+    return (cv_json.get("contact") or _NO_CONTACT).get("full_name", default)
+
+
+def _empty_pdf_message(destination: object) -> str:
+    return (
+        f"WeasyPrint write_pdf completed without error but wrote "
+        f"no data to {destination}. This usually "
+        f"means system libraries (Pango/GLib) are not accessible — "
+        f"set DYLD_LIBRARY_PATH=/opt/homebrew/lib on macOS."
+    )
+
+
+def _format_date_obj(date_value: date) -> str:
+    return f"{_MONTHS[date_value.month - 1]} {date_value.year}"
+
+
+def _format_missing_date(_: None) -> str:
+    return "Present"
+
+
+# Exact-type dispatch for the format_date filter: one dict lookup instead of an
+# isinstance chain. Subclasses (str enums, pandas timestamps, ...) miss here
+# and take the isinstance fallback in PDFGenerator._format_date.
+_DATE_FORMATTERS = {
+    str: _format_date_str,
+    type(None): _format_missing_date,
+    date: _format_date_obj,
+    datetime: _format_date_obj,
+}
+
+
 class PDFGenerator:
     """Generates professional PDF resumes from CV JSON data using WeasyPrint"""
 
     SUPPORTED_TEMPLATES = ["modern", "classic", "minimal", "compact", "profile-card"]
     DEFAULT_TEMPLATE = "modern"
 
+    # Metadata fields that are the same for every generated PDF
+    _STATIC_METADATA = {
+        "subject": "Professional Resume",
+        "creator": "LinkedIn Job Application Agent",
+    }
+
     def __init__(
         self,
         template_dir: str | Path = "src/templates/cv",
         template_name: str = DEFAULT_TEMPLATE,
         font_config: FontConfiguration | None = None,
+        auto_reload: bool = False,
+        bytecode_cache_dir: str | Path | None = None,
     ):
         """
         Initialize PDF Generator with template configuration
@@ -30,42 +149,73 @@ class PDFGenerator:
             template_dir: Directory containing CV templates
             template_name: Name of template theme to use (modern/classic/minimal)
             font_config: Optional WeasyPrint font configuration
+            auto_reload: Re-check template files for edits on every render
+            bytecode_cache_dir: Directory for compiled template bytecode, so a
+                restarted process loads the template instead of recompiling it
 
         Raises:
             ValueError: If template directory or theme doesn't exist
         """
         self.template_dir = Path(template_dir)
         self.template_name = template_name
-        self.font_config = font_config or FontConfiguration()
+        # None means a configuration of this generator's own, built on first
+        # render so HTML-only use (render_html) never loads WeasyPrint.
+        self._font_config = font_config
 
         # Validate template exists
         template_path = self.template_dir / template_name
         if not template_path.exists():
             raise ValueError(f"Template '{template_name}' not found at {template_path}")
+        # Resolves relative asset URLs in the rendered HTML
+        self._base_url = str(template_path)
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir), "cv_%s.cache")
 
         # Setup Jinja2 environment
         self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_dir / template_name)),
+            loader=FileSystemLoader(self._base_url),
             autoescape=select_autoescape(["html", "xml"]),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=auto_reload,
+            # One environment per theme directory: never evict what was loaded
+            cache_size=-1,
+            bytecode_cache=bytecode_cache,
         )
 
         # Register custom filters
         self.jinja_env.filters["format_date"] = self._format_date
 
-        # Cache CSS at initialization to avoid repeated file reads
-        self._cached_css: str | None = None
-        self._load_and_cache_css()
+        # Compile the template once; with auto_reload off, renders skip the
+        # loader lookup and mtime check entirely.
+        self._auto_reload = auto_reload
+        self._template = self.jinja_env.get_template("template.html.j2")
+        self._standalone_template = self.jinja_env.from_string(_STANDALONE_HTML)
 
-        logger.info(f"PDFGenerator initialized with template: {template_name}")
+        # Read (and validate) the stylesheet up front; the text is shared
+        # process-wide through _read_css.
+        self._css_path = template_path / "style.css"
+        self._load_css()
+
+        # (stylesheet text, parsed stylesheet), built on first PDF render and
+        # rebuilt when the text changes. Parsing resolves the stylesheet's
+        # @import (web fonts) and registers its @font-face rules in
+        # font_config, so it must not happen per PDF.
+        self._css: tuple[str, CSS] | None = None
 
-    def _load_and_cache_css(self) -> None:
-        """Load and cache CSS file for current template"""
-        css_path = self.template_dir / self.template_name / "style.css"
-        with open(css_path, encoding="utf-8") as f:
-            self._cached_css = f.read()
-        logger.debug(f"Cached CSS from {css_path}")
+        # Instances are shared across worker threads (see get_pdf_generator);
+        # WeasyPrint's FontConfiguration is not safe for concurrent renders,
+        # so renders through this generator (and its font_config) take turns.
+        # Generators for other templates render in parallel.
+        self._render_lock = threading.Lock()
+
+        # render_html output keyed by (CV digest, stylesheet text); see render_html
+        self._html_cache: OrderedDict[tuple[bytes, str], str] = OrderedDict()
+
+        logger.info(f"PDFGenerator initialized with template: {template_name}")
 
     def generate_pdf(
         self,
@@ -88,52 +238,91 @@ class PDFGenerator:
             ValueError: If CV data is invalid
             IOError: If PDF generation fails
         """
-        full_name = cv_json.get("contact", {}).get("full_name", "Unknown")
+        full_name = _full_name(cv_json, "Unknown")
         logger.info(f"Generating PDF for {full_name}")
 
         try:
-            # Step 1: Convert CV JSON to HTML
-            html_content = self._cv_to_html(cv_json)
-
-            # Step 2: Load CSS
-            css_content = self._load_css()
-
-            # Step 3: Generate PDF using WeasyPrint
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Create HTML and CSS objects
-            base_url = str(self.template_dir / self.template_name)
-            html = HTML(string=html_content, base_url=base_url)
-            css = CSS(string=css_content, font_config=self.font_config)
+            # Lay the document out before touching the filesystem, then write
+            # it to a sibling temp file and swap that into place: a failed
+            # (re-)render never truncates a previously good PDF.
+            document = self._render_document(cv_json, metadata)
+            tmp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                with tmp_path.open("xb") as f:
+                    written = self._write_document(document, f)
+                if not written:
+                    raise OSError(_empty_pdf_message(output_path))
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
-            # Set PDF metadata
-            pdf_metadata = self._build_metadata(cv_json, metadata)
+            logger.info(f"PDF generated successfully: {output_path}")
+            return str(output_path.absolute())
 
-            # Generate PDF
-            document = html.render(stylesheets=[css], font_config=self.font_config)
+        except Exception as e:
+            logger.error(f"PDF generation failed: {e}", exc_info=True)
+            raise OSError(f"Failed to generate PDF: {e}") from e
 
-            # Set metadata attributes (WeasyPrint DocumentMetadata doesn't have update())
-            for key, value in pdf_metadata.items():
-                setattr(document.metadata, key, value)
+    def generate_pdf_bytes(self, cv_json: dict, metadata: dict | None = None) -> bytes:
+        """
+        Generate PDF from CV JSON data in memory, without touching disk
 
-            document.write_pdf(str(output_path))
+        Args:
+            cv_json: CV data as dictionary (matches CV Pydantic model)
+            metadata: Optional PDF metadata (title, author, etc.)
 
-            if not output_path.exists():
-                raise OSError(
-                    f"WeasyPrint write_pdf completed without error but the "
-                    f"file was not created at {output_path}. This usually "
-                    f"means system libraries (Pango/GLib) are not accessible — "
-                    f"set DYLD_LIBRARY_PATH=/opt/homebrew/lib on macOS."
-                )
+        Returns:
+            The PDF document bytes
 
-            logger.info(f"PDF generated successfully: {output_path}")
-            return str(output_path.absolute())
+        Raises:
+            IOError: If PDF generation fails
+        """
+        full_name = _full_name(cv_json, "Unknown")
+        logger.info(f"Generating in-memory PDF for {full_name}")
+
+        try:
+            document = self._render_document(cv_json, metadata)
+            buffer = io.BytesIO()
+            if not self._write_document(document, buffer):
+                raise OSError(_empty_pdf_message("the output buffer"))
+            return buffer.getvalue()
 
         except Exception as e:
             logger.error(f"PDF generation failed: {e}", exc_info=True)
             raise OSError(f"Failed to generate PDF: {e}") from e
 
+    def _render_document(self, cv_json: dict, metadata: dict | None) -> Document:
+        """Lay the CV out as a WeasyPrint document, with PDF metadata set"""
+        from weasyprint import HTML
+
+        # Step 1: Convert CV JSON to HTML
+        html_content = self._cv_to_html(cv_json)
+
+        # Step 2: Lay out the pages using WeasyPrint
+        html = HTML(string=html_content, base_url=self._base_url)
+        pdf_metadata = self._build_metadata(cv_json, metadata)
+
+        with self._render_lock:
+            css = self._get_css()
+            document = html.render(stylesheets=[css], font_config=self.font_config)
+
+        # Set metadata attributes (WeasyPrint DocumentMetadata doesn't have update())
+        for key, value in pdf_metadata.items():
+            setattr(document.metadata, key, value)
+        return document
+
+    def _write_document(self, document: Document, target: BinaryIO) -> int:
+        """Stream the PDF for ``document`` into ``target``; returns bytes written"""
+        start = target.tell()
+        # Font embedding reads through font_config too
+        with self._render_lock:
+            document.write_pdf(target=target)
+        return target.tell() - start
+
     def _cv_to_html(self, cv_json: dict) -> str:
         """
         Convert CV JSON to HTML using Jinja2 template
@@ -144,9 +333,9 @@ class PDFGenerator:
         Returns:
             Rendered HTML string
         """
-        template = self.jinja_env.get_template("template.html.j2")
-        html = template.render(cv=cv_json)
-        return html
+        if self._auto_reload:
+            return self.jinja_env.get_template("template.html.j2").render(cv=cv_json)
+        return self._template.render(cv=cv_json)
 
     def render_html(self, cv_json: dict) -> str:
         """
@@ -161,49 +350,79 @@ class PDFGenerator:
         Returns:
             Complete HTML string with embedded CSS
         """
+        css_content = self._load_css()
+
+        # The preview is a pure function of the CV and the stylesheet, and the
+        # UI re-requests it for the same job. Skipped under auto_reload, where
+        # template edits must show up immediately.
+        key = None
+        if not self._auto_reload:
+            try:
+                digest = hashlib.blake2b(
+                    orjson.dumps(cv_json, option=orjson.OPT_SORT_KEYS), digest_size=16
+                ).digest()
+            except TypeError:
+                pass  # not JSON-serialisable; render uncached
+            else:
+                key = (digest, css_content)
+                cached = self._html_cache.get(key)
+                if cached is not None:
+                    self._html_cache.move_to_end(key)
+                    return cached
+
         # Get the base HTML content
         html_content = self._cv_to_html(cv_json)
-        css_content = self._load_css()
 
         # Embed CSS into HTML for standalone rendering
-        # Wrap in a complete HTML document structure
-        full_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{cv_json.get('contact', {}).get('full_name', 'CV')} - Resume</title>
-    <style>
-{css_content}
-    </style>
-</head>
-<body>
-{html_content}
-</body>
-</html>"""
+        full_html = self._standalone_template.render(
+            title=_full_name(cv_json, "CV"),
+            css=css_content,
+            body=html_content,
+        )
+        if key is not None:
+            self._html_cache[key] = full_html
+            while len(self._html_cache) > _HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
         return full_html
 
     def _load_css(self) -> str:
-        """Return cached CSS for current template"""
-        if self._cached_css is None:
-            self._load_and_cache_css()
-        return self._cached_css
+        """Return CSS for current template, re-read only after the file changes"""
+        return _read_css(str(self._css_path), self._css_path.stat().st_mtime_ns)
+
+    @property
+    def font_config(self) -> FontConfiguration:
+        """This generator's WeasyPrint font configuration, built on first use."""
+        if self._font_config is None:
+            from weasyprint.text.fonts import FontConfiguration
+
+            self._font_config = FontConfiguration()
+        return self._font_config
+
+    def _get_css(self) -> CSS:
+        """Return the parsed stylesheet, re-parsing it only when the
+        stylesheet text changed on disk.
+
+        Relative url() references resolve against the template directory,
+        the same base the rendered HTML uses.
+        """
+        css_text = self._load_css()
+        if self._css is None or self._css[0] != css_text:
+            from weasyprint import CSS
+
+            parsed = CSS(string=css_text, base_url=self._base_url, font_config=self.font_config)
+            self._css = (css_text, parsed)
+        return self._css[1]
 
     def _build_metadata(self, cv_json: dict, custom_metadata: dict | None) -> dict:
         """Build PDF metadata dictionary"""
-        full_name = cv_json.get("contact", {}).get("full_name", "Unknown")
-        metadata = {
+        full_name = _full_name(cv_json, "Unknown")
+        return {
+            **self._STATIC_METADATA,
             "title": f"{full_name} - Resume",
             "author": full_name,
-            "subject": "Professional Resume",
-            "creator": "LinkedIn Job Application Agent",
+            **(custom_metadata or {}),
         }
 
-        if custom_metadata:
-            metadata.update(custom_metadata)
-
-        return metadata
-
     @staticmethod
     def _format_date(date_value: str | date | None) -> str:
         """
@@ -215,19 +434,33 @@ class PDFGenerator:
         Returns:
             Formatted date string (e.g., "Jan 2020") or "Present" for None
         """
-        if date_value is None:
-            return "Present"
+        formatter = _DATE_FORMATTERS.get(type(date_value))
+        if formatter is not None:
+            return formatter(date_value)
 
         if isinstance(date_value, str):
-            if not date_value or date_value.lower() in ["present", "current"]:
-                return "Present"
-            try:
-                date_obj = date.fromisoformat(date_value)
-            except ValueError:
-                return date_value
-        elif isinstance(date_value, date):
-            date_obj = date_value
-        else:
-            return str(date_value)
-
-        return date_obj.strftime("%b %Y")
+            return _format_date_str(date_value)
+        if isinstance(date_value, date):
+            return _format_date_obj(date_value)
+        return str(date_value)
+
+
+@lru_cache(maxsize=8)
+def get_pdf_generator(
+    template_dir: str = "src/templates/cv",
+    template_name: str = PDFGenerator.DEFAULT_TEMPLATE,
+    auto_reload: bool = False,
+    bytecode_cache_dir: str | None = None,
+) -> PDFGenerator:
+    """Return the process-wide generator for a template.
+
+    A generator holds the compiled Jinja template and the parsed stylesheet,
+    so callers that render per job share one instance per template instead of
+    rebuilding both each time.
+    """
+    return PDFGenerator(
+        template_dir=template_dir,
+        template_name=template_name,
+        auto_reload=auto_reload,
+        bytecode_cache_dir=bytecode_cache_dir,
+    )
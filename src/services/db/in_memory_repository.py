@@ -5,21 +5,46 @@ Data is lost on restart — use SQLiteJobRepository for persistence.
 
 import asyncio
 import logging
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 
 from src.models.cv_attempt import CVCompositionAttempt
 from src.models.state_machine import BusinessState, validate_transition
-from src.models.unified import JobRecord
+from src.models.unified import JobRecord, JobRecordSummary
 
 from .repository import (
     UPDATABLE_FIELDS,
+    Cursor,
     JobRepository,
     RepositoryError,
+    _check_pagination,
     _unlink_pdfs,
 )
 
 logger = logging.getLogger(__name__)
 
+_BY_CREATED = attrgetter("created_at")
+_BY_UPDATED = attrgetter("updated_at")
+_BY_ATTEMPT = attrgetter("attempt_number")
+
+
+def _detached(job: JobRecord) -> JobRecord:
+    """Shallow copy of a stored record for callers.
+
+    Stored records back the sorted indexes, so callers never get the live
+    object: assigning a timestamp or status on it would desync them.
+    """
+    return job.model_copy()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive timestamps are taken as UTC; every index key must be tz-aware
+    or ``insort`` raises ``TypeError`` comparing naive with aware."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
 
 class InMemoryJobRepository(JobRepository):
     """In-memory implementation of JobRepository."""
@@ -27,6 +52,15 @@ class InMemoryJobRepository(JobRepository):
     def __init__(self):
         self._jobs: dict[str, JobRecord] = {}
         self._cv_attempts: dict[str, list[CVCompositionAttempt]] = {}
+        # application_url -> job_ids in insertion order. URLs are not unique
+        # (several users may save the same posting), so each maps to a list.
+        self._url_index: dict[str, list[str]] = {}
+        # status -> job_ids, so status-filtered queries touch only matching rows.
+        self._by_status: defaultdict[str, set[str]] = defaultdict(set)
+        # (timestamp, job_id) keys kept sorted on insert, in the same order as
+        # the SQLite keyset, so list queries walk in order instead of sorting.
+        self._by_created: list[Cursor] = []
+        self._by_updated: list[Cursor] = []
         self._initialized: bool = False
         self._lock: asyncio.Lock = asyncio.Lock()
 
@@ -40,8 +74,87 @@ class InMemoryJobRepository(JobRepository):
     async def close(self) -> None:
         self._jobs.clear()
         self._cv_attempts.clear()
+        self._url_index.clear()
+        self._by_status.clear()
+        self._by_created.clear()
+        self._by_updated.clear()
         self._initialized = False
 
+    # =========================================================================
+    # Secondary Indexes
+    # =========================================================================
+
+    def _index_add(self, job: JobRecord) -> None:
+        self._by_status[str(job.status)].add(job.job_id)
+        insort(self._by_created, (job.created_at, job.job_id))
+        insort(self._by_updated, (job.updated_at, job.job_id))
+        if job.application_url:
+            self._url_index.setdefault(job.application_url, []).append(job.job_id)
+
+    def _index_remove(self, job: JobRecord) -> None:
+        self._by_status[str(job.status)].discard(job.job_id)
+        for keys, key in (
+            (self._by_created, (job.created_at, job.job_id)),
+            (self._by_updated, (job.updated_at, job.job_id)),
+        ):
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+        if job.application_url:
+            ids = self._url_index.get(job.application_url)
+            if ids is not None:
+                ids.remove(job.job_id)
+                if not ids:
+                    del self._url_index[job.application_url]
+
+    def _in_statuses(self, statuses: Iterable[str]) -> list[JobRecord]:
+        return [
+            self._jobs[job_id]
+            for status in {str(s) for s in statuses}
+            for job_id in self._by_status.get(status, ())
+        ]
+
+    def _walk(
+        self,
+        keys: list[Cursor],
+        match: Callable[[JobRecord], bool],
+        limit: int | None,
+        *,
+        order_desc: bool = True,
+        offset: int = 0,
+        after: Cursor | None = None,
+    ) -> list[JobRecord]:
+        """Collect one page of matching jobs by walking a sorted key list.
+
+        Stops as soon as ``limit`` matches are found; ``after`` is located by
+        bisection rather than by filtering.
+        """
+        if not keys:
+            return []
+        if order_desc:
+            end = bisect_left(keys, after) if after is not None else len(keys)
+            ordered = (keys[i] for i in range(end - 1, -1, -1))
+        else:
+            start = bisect_right(keys, after) if after is not None else 0
+            ordered = (keys[i] for i in range(start, len(keys)))
+
+        page: list[JobRecord] = []
+        for _, job_id in ordered:
+            job = self._jobs[job_id]
+            if not match(job):
+                continue
+            if offset:
+                offset -= 1
+                continue
+            page.append(_detached(job))
+            if limit is not None and len(page) >= limit:
+                break
+        return page
+
+    def _pop_job(self, job_id: str) -> None:
+        self._index_remove(self._jobs.pop(job_id))
+        self._cv_attempts.pop(job_id, None)
+
     # =========================================================================
     # CRUD Methods
     # =========================================================================
@@ -50,37 +163,75 @@ class InMemoryJobRepository(JobRepository):
         async with self._lock:
             if job.job_id in self._jobs:
                 raise RepositoryError(f"Job already exists: {job.job_id}", job.job_id)
+            # Store a private copy so the caller's object stays theirs to edit.
+            job = job.model_copy(
+                update={
+                    "created_at": _as_utc(job.created_at),
+                    "updated_at": _as_utc(job.updated_at),
+                }
+            )
             self._jobs[job.job_id] = job
+            self._index_add(job)
             return job.job_id
 
     async def get(self, job_id: str) -> JobRecord | None:
-        return self._jobs.get(job_id)
+        job = self._jobs.get(job_id)
+        return _detached(job) if job is not None else None
 
     async def update(self, job_id: str, updates: dict) -> None:
         async with self._lock:
-            if job_id not in self._jobs:
+            job = self._jobs.get(job_id)
+            if job is None:
                 raise RepositoryError(f"Job not found: {job_id}", job_id)
+            self._check_update(job_id, job.status, updates)
 
-            invalid_fields = set(updates.keys()) - UPDATABLE_FIELDS
-            if invalid_fields:
-                raise ValueError(f"Invalid update fields: {invalid_fields}")
+            updates["updated_at"] = datetime.now(tz=timezone.utc)
+            self._apply_update(job, updates)
 
-            if "status" in updates:
-                current_status = self._jobs[job_id].status
-                new_status = updates["status"]
-                if not isinstance(current_status, BusinessState):
-                    current_status = BusinessState(current_status)
-                if not isinstance(new_status, BusinessState):
-                    new_status = BusinessState(new_status)
-                validate_transition(current_status, new_status, job_id)
+    async def update_many(self, patches: list[tuple[str, dict]]) -> None:
+        async with self._lock:
+            # Validate the whole batch before touching anything, tracking each
+            # job's status as earlier patches would leave it.
+            statuses: dict[str, BusinessState | str] = {}
+            for job_id, updates in patches:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    raise RepositoryError(f"Job not found: {job_id}", job_id)
+                self._check_update(job_id, statuses.get(job_id, job.status), updates)
+                if "status" in updates:
+                    statuses[job_id] = updates["status"]
 
-            updates["updated_at"] = datetime.now(tz=timezone.utc)
-            self._jobs[job_id] = self._jobs[job_id].model_copy(update=updates)
+            now = datetime.now(tz=timezone.utc)
+            for job_id, updates in patches:
+                updates["updated_at"] = now
+                self._apply_update(self._jobs[job_id], updates)
+
+    @staticmethod
+    def _check_update(job_id: str, current_status: BusinessState | str, updates: dict) -> None:
+        invalid_fields = set(updates.keys()) - UPDATABLE_FIELDS
+        if invalid_fields:
+            raise ValueError(f"Invalid update fields: {invalid_fields}")
+
+        if "status" in updates:
+            new_status = updates["status"]
+            if not isinstance(current_status, BusinessState):
+                current_status = BusinessState(current_status)
+            if not isinstance(new_status, BusinessState):
+                new_status = BusinessState(new_status)
+            validate_transition(current_status, new_status, job_id)
+
+    def _apply_update(self, job: JobRecord, updates: dict) -> None:
+        # The record is owned by the repository, so mutate it in place
+        # (UPDATABLE_FIELDS already vetted the keys) instead of copying it.
+        self._index_remove(job)
+        for field, value in updates.items():
+            setattr(job, field, value)
+        self._index_add(job)
 
     async def delete(self, job_id: str) -> bool:
         async with self._lock:
             if job_id in self._jobs:
-                del self._jobs[job_id]
+                self._index_remove(self._jobs.pop(job_id))
                 return True
             return False
 
@@ -91,11 +242,13 @@ class InMemoryJobRepository(JobRepository):
                 return None
             if str(job.status) != BusinessState.FAILED.value:
                 return None
+            self._index_remove(job)
             job.status = BusinessState.QUEUED
             job.error_message = None
             job.last_scrape_error = None
             job.updated_at = datetime.now(tz=timezone.utc)
-            return job
+            self._index_add(job)
+            return _detached(job)
 
     async def delete_for_user(self, job_id: str, user_id: str) -> bool:
         pdf_paths: list[str] = []
@@ -110,8 +263,7 @@ class InMemoryJobRepository(JobRepository):
                 if attempt.pdf_path:
                     pdf_paths.append(attempt.pdf_path)
 
-            del self._jobs[job_id]
-            self._cv_attempts.pop(job_id, None)
+            self._pop_job(job_id)
 
         _unlink_pdfs(pdf_paths, job_id)
         return True
@@ -129,8 +281,7 @@ class InMemoryJobRepository(JobRepository):
                 if attempt.pdf_path:
                     pdf_paths.append(attempt.pdf_path)
 
-            del self._jobs[job_id]
-            self._cv_attempts.pop(job_id, None)
+            self._pop_job(job_id)
 
         _unlink_pdfs(pdf_paths, job_id)
         return True
@@ -142,16 +293,18 @@ class InMemoryJobRepository(JobRepository):
     async def get_for_user(self, job_id: str, user_id: str) -> JobRecord | None:
         job = self._jobs.get(job_id)
         if job and job.user_id == user_id:
-            return job
+            return _detached(job)
         return None
 
     async def get_pending(self, user_id: str) -> list[JobRecord]:
-        jobs = [
-            j for j in self._jobs.values()
-            if j.status == BusinessState.PENDING and j.user_id == user_id
-        ]
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-        return jobs
+        pending = self._by_status.get(BusinessState.PENDING.value)
+        if not pending:
+            return []
+        return self._walk(
+            self._by_created,
+            lambda j: j.job_id in pending and j.user_id == user_id,
+            None,
+        )
 
     async def get_by_status(
         self,
@@ -161,37 +314,72 @@ class InMemoryJobRepository(JobRepository):
         offset: int = 0,
         order_by: str = "created_at",
         order_desc: bool = True,
+        after: Cursor | None = None,
     ) -> list[JobRecord]:
-        jobs = [
-            j for j in self._jobs.values()
-            if j.status == status and j.user_id == user_id
-        ]
-
-        if order_by == "updated_at":
-            jobs.sort(key=lambda j: j.updated_at, reverse=order_desc)
-        else:
-            jobs.sort(key=lambda j: j.created_at, reverse=order_desc)
-
-        return jobs[offset:offset + limit]
+        _check_pagination("get_by_status", offset, after)
+        bucket = self._by_status.get(str(status))
+        if not bucket:
+            return []
+        keys = self._by_updated if order_by == "updated_at" else self._by_created
+        return self._walk(
+            keys,
+            lambda j: j.job_id in bucket and j.user_id == user_id,
+            limit,
+            order_desc=order_desc,
+            offset=offset,
+            after=after,
+        )
 
-    async def get_all(self, user_id: str, limit: int = 100, offset: int = 0) -> list[JobRecord]:
-        jobs = sorted(
-            [j for j in self._jobs.values() if j.user_id == user_id],
-            key=lambda j: j.created_at, reverse=True,
+    async def get_all(
+        self,
+        user_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Cursor | None = None,
+    ) -> list[JobRecord]:
+        _check_pagination("get_all", offset, after)
+        return self._walk(
+            self._by_created,
+            lambda j: j.user_id == user_id,
+            limit,
+            offset=offset,
+            after=after,
         )
-        return jobs[offset:offset + limit]
 
     async def get_history(
         self,
         user_id: str,
         limit: int = 50,
         statuses: list[str] | None = None,
+        after: Cursor | None = None,
     ) -> list[JobRecord]:
-        jobs = [j for j in self._jobs.values() if j.user_id == user_id]
+        if statuses and len(statuses) == 1:
+            return await self.get_by_status(
+                user_id, statuses[0], limit=limit, order_by="updated_at", after=after
+            )
         if statuses:
-            jobs = [j for j in jobs if j.status in statuses]
-        jobs.sort(key=lambda j: j.updated_at, reverse=True)
-        return jobs[:limit]
+            wanted = {str(s) for s in statuses}
+            if not any(self._by_status.get(s) for s in wanted):
+                return []
+            return self._walk(
+                self._by_updated,
+                lambda j: j.user_id == user_id and str(j.status) in wanted,
+                limit,
+                after=after,
+            )
+        return self._walk(
+            self._by_updated, lambda j: j.user_id == user_id, limit, after=after
+        )
+
+    async def get_history_summaries(
+        self,
+        user_id: str,
+        limit: int = 50,
+        statuses: list[str] | None = None,
+        after: Cursor | None = None,
+    ) -> list[JobRecordSummary]:
+        jobs = await self.get_history(user_id, limit=limit, statuses=statuses, after=after)
+        return [JobRecordSummary.from_record(j) for j in jobs]
 
     async def list_by_states(
         self,
@@ -200,14 +388,12 @@ class InMemoryJobRepository(JobRepository):
         user_id: str | None = None,
         limit: int = 200,
     ) -> list[JobRecord]:
-        state_values = {str(s) for s in states}
         jobs = [
-            j for j in self._jobs.values()
-            if str(j.status) in state_values
-            and (user_id is None or j.user_id == user_id)
+            j for j in self._in_statuses(states)
+            if user_id is None or j.user_id == user_id
         ]
-        jobs.sort(key=lambda j: j.updated_at, reverse=True)
-        return jobs[:limit]
+        jobs.sort(key=_BY_UPDATED, reverse=True)
+        return [_detached(j) for j in jobs[:limit]]
 
     async def get_status_counts(self, user_id: str) -> dict[str, int]:
         counts: dict[str, int] = {}
@@ -225,8 +411,8 @@ class InMemoryJobRepository(JobRepository):
             j for j in self._jobs.values()
             if j.user_id == user_id and j.refine_signal_state == state
         ]
-        jobs.sort(key=lambda j: j.updated_at, reverse=True)
-        return jobs[:limit]
+        jobs.sort(key=_BY_UPDATED, reverse=True)
+        return [_detached(j) for j in jobs[:limit]]
 
     async def mark_refine_signals(self, job_ids: list[str], state: str) -> None:
         async with self._lock:
@@ -234,17 +420,17 @@ class InMemoryJobRepository(JobRepository):
             for job_id in job_ids:
                 job = self._jobs.get(job_id)
                 if job is not None:
-                    self._jobs[job_id] = job.model_copy(
-                        update={"refine_signal_state": state, "updated_at": now}
-                    )
+                    self._index_remove(job)
+                    job.refine_signal_state = state
+                    job.updated_at = now
+                    self._index_add(job)
 
     # =========================================================================
     # Admin-scope Query Methods
     # =========================================================================
 
-    def _matches_admin_filters(
+    def _admin_matches(
         self,
-        job: JobRecord,
         *,
         user_ids: list[str] | None,
         statuses: list[str] | None,
@@ -252,29 +438,35 @@ class InMemoryJobRepository(JobRepository):
         created_from: datetime | None,
         created_to: datetime | None,
         search: str | None,
-    ) -> bool:
-        if user_ids and job.user_id not in user_ids:
-            return False
-        if statuses and str(job.status) not in statuses:
-            return False
-        if sources and job.source not in sources:
-            return False
-        if created_from and job.created_at < created_from:
-            return False
-        if created_to and job.created_at > created_to:
-            return False
-        if search:
-            needle = search.lower()
-            haystacks: list[str] = []
-            if job.job_posting:
-                haystacks.append(str(job.job_posting.get("title", "")))
-                haystacks.append(str(job.job_posting.get("company", "")))
-                haystacks.append(str(job.job_posting.get("description", "")))
-            if job.error_message:
-                haystacks.append(job.error_message)
-            if not any(needle in h.lower() for h in haystacks):
-                return False
-        return True
+    ) -> list[JobRecord]:
+        """Jobs matching the admin filters, in no particular order.
+
+        A status filter reads from the status buckets; the other list filters
+        become sets once per call rather than being scanned per job.
+        """
+        candidates = self._in_statuses(statuses) if statuses else self._jobs.values()
+        user_set = frozenset(user_ids) if user_ids else None
+        source_set = frozenset(sources) if sources else None
+        needle = search.lower() if search else None
+        return [
+            j for j in candidates
+            if (user_set is None or j.user_id in user_set)
+            and (source_set is None or j.source in source_set)
+            and not (created_from and j.created_at < created_from)
+            and not (created_to and j.created_at > created_to)
+            and (needle is None or self._matches_search(j, needle))
+        ]
+
+    @staticmethod
+    def _matches_search(job: JobRecord, needle: str) -> bool:
+        haystacks: list[str] = []
+        if job.job_posting:
+            haystacks.append(str(job.job_posting.get("title", "")))
+            haystacks.append(str(job.job_posting.get("company", "")))
+            haystacks.append(str(job.job_posting.get("description", "")))
+        if job.error_message:
+            haystacks.append(job.error_message)
+        return any(needle in h.lower() for h in haystacks)
 
     async def list_all_jobs(
         self,
@@ -288,20 +480,16 @@ class InMemoryJobRepository(JobRepository):
         limit: int = 50,
         offset: int = 0,
     ) -> list[JobRecord]:
-        matches = [
-            j for j in self._jobs.values()
-            if self._matches_admin_filters(
-                j,
-                user_ids=user_ids,
-                statuses=statuses,
-                sources=sources,
-                created_from=created_from,
-                created_to=created_to,
-                search=search,
-            )
-        ]
-        matches.sort(key=lambda j: j.created_at, reverse=True)
-        return matches[offset:offset + limit]
+        matches = self._admin_matches(
+            user_ids=user_ids,
+            statuses=statuses,
+            sources=sources,
+            created_from=created_from,
+            created_to=created_to,
+            search=search,
+        )
+        matches.sort(key=_BY_CREATED, reverse=True)
+        return [_detached(j) for j in matches[offset:offset + limit]]
 
     async def count_all_jobs(
         self,
@@ -313,18 +501,14 @@ class InMemoryJobRepository(JobRepository):
         created_to: datetime | None = None,
         search: str | None = None,
     ) -> int:
-        return sum(
-            1 for j in self._jobs.values()
-            if self._matches_admin_filters(
-                j,
-                user_ids=user_ids,
-                statuses=statuses,
-                sources=sources,
-                created_from=created_from,
-                created_to=created_to,
-                search=search,
-            )
-        )
+        return len(self._admin_matches(
+            user_ids=user_ids,
+            statuses=statuses,
+            sources=sources,
+            created_from=created_from,
+            created_to=created_to,
+            search=search,
+        ))
 
     async def count_by_status_global(
         self, window_hours: int | None = None
@@ -341,13 +525,16 @@ class InMemoryJobRepository(JobRepository):
         return counts
 
     async def get_latest_session_auth(self) -> dict | None:
-        candidates = [
-            j for j in self._jobs.values()
-            if j.source == "linkedin" and j.session_authenticated is not None
-        ]
-        if not candidates:
+        latest = max(
+            (
+                j for j in self._jobs.values()
+                if j.source == "linkedin" and j.session_authenticated is not None
+            ),
+            key=_BY_CREATED,
+            default=None,
+        )
+        if latest is None:
             return None
-        latest = max(candidates, key=lambda j: j.created_at)
         return {
             "authenticated": bool(latest.session_authenticated),
             "job_id": latest.job_id,
@@ -360,15 +547,16 @@ class InMemoryJobRepository(JobRepository):
         offset: int = 0,
         since: datetime | None = None,
     ) -> list[JobRecord]:
+        since_aware = None
+        if since is not None:
+            since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
         matches = [
             j for j in self._jobs.values()
             if (j.error_message or j.last_scrape_error)
+            and (since_aware is None or (j.updated_at and j.updated_at >= since_aware))
         ]
-        if since is not None:
-            since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
-            matches = [j for j in matches if j.updated_at and j.updated_at >= since_aware]
-        matches.sort(key=lambda j: j.updated_at, reverse=True)
-        return matches[offset:offset + limit]
+        matches.sort(key=_BY_UPDATED, reverse=True)
+        return [_detached(j) for j in matches[offset:offset + limit]]
 
     # =========================================================================
     # CV Attempt Methods
@@ -382,22 +570,23 @@ class InMemoryJobRepository(JobRepository):
 
     async def get_cv_attempts(self, job_id: str) -> list[CVCompositionAttempt]:
         attempts = self._cv_attempts.get(job_id, [])
-        return sorted(attempts, key=lambda a: a.attempt_number)
+        return sorted(attempts, key=_BY_ATTEMPT)
 
     async def get_latest_cv_attempt(self, job_id: str) -> CVCompositionAttempt | None:
         attempts = self._cv_attempts.get(job_id, [])
         if not attempts:
             return None
-        return max(attempts, key=lambda a: a.attempt_number)
+        return max(attempts, key=_BY_ATTEMPT)
 
     # =========================================================================
     # Specialized Methods
     # =========================================================================
 
     async def find_by_application_url(self, url: str, user_id: str | None = None) -> JobRecord | None:
-        for job in self._jobs.values():
-            if job.application_url == url and (user_id is None or job.user_id == user_id):
-                return job
+        for job_id in self._url_index.get(url, ()):
+            job = self._jobs[job_id]
+            if user_id is None or job.user_id == user_id:
+                return _detached(job)
         return None
 
     async def cleanup(
@@ -414,15 +603,13 @@ class InMemoryJobRepository(JobRepository):
         cutoff_date = datetime.now(tz=timezone.utc) - timedelta(days=older_than_days)
         async with self._lock:
             to_delete = [
-                job_id
-                for job_id, job in self._jobs.items()
-                if job.status in statuses
-                and job.created_at < cutoff_date
+                job.job_id
+                for job in self._in_statuses(statuses)
+                if job.created_at < cutoff_date
                 and (user_id is None or job.user_id == user_id)
             ]
 
             for job_id in to_delete:
-                del self._jobs[job_id]
-                self._cv_attempts.pop(job_id, None)
+                self._pop_job(job_id)
 
             return len(to_delete)
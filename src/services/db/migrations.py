@@ -88,6 +88,40 @@ def _add_column(
     return runner
 
 
+def _create_index(
+    table: str, index: str, columns: str
+) -> Callable[[object], Awaitable[bool | None]]:
+    async def runner(conn) -> bool | None:
+        if not await _table_exists(conn, table):
+            return None  # table not created yet — try again next run
+        cursor = await conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name=?",
+            (index,),
+        )
+        if await cursor.fetchone() is not None:
+            return False
+        logger.info("Migrating: create index %s on %s (%s)", index, table, columns)
+        await conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({columns})")
+        return True
+
+    return runner
+
+
+def _drop_index(index: str) -> Callable[[object], Awaitable[bool | None]]:
+    async def runner(conn) -> bool | None:
+        cursor = await conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name=?",
+            (index,),
+        )
+        if await cursor.fetchone() is None:
+            return False
+        logger.info("Migrating: drop index %s", index)
+        await conn.execute(f"DROP INDEX IF EXISTS {index}")
+        return True
+
+    return runner
+
+
 async def _reindex_user(conn) -> None:
     # SQLite lets CREATE INDEX reference a not-yet-existing column,
     # so pre-existing rows are missing from the index until REINDEX.
@@ -173,6 +207,37 @@ MIGRATIONS: tuple[Migration, ...] = (
         "add_user_pending_refinement",
         _add_column("user", "pending_refinement", "pending_refinement JSON NULL"),
     ),
+    # Composite indexes for the per-user list queries: equality on the leading
+    # columns, then the sort column and job_id (the keyset tie-break), so
+    # SQLite walks the index in ORDER BY order instead of sorting a temp B-tree.
+    Migration(
+        "add_job_user_status_created_index",
+        _create_index(
+            "job", "idx_job_user_status_created", "user_id, status, created_at, job_id"
+        ),
+    ),
+    Migration(
+        "add_job_user_status_updated_index",
+        _create_index(
+            "job", "idx_job_user_status_updated", "user_id, status, updated_at, job_id"
+        ),
+    ),
+    Migration(
+        "add_job_user_updated_index",
+        _create_index("job", "idx_job_user_updated", "user_id, updated_at, job_id"),
+    ),
+    # Same shape for the cross-user status queries (startup recovery, the HITL
+    # pending sweep, admin listings). They make the single-column status index
+    # Piccolo used to create redundant, so drop it rather than maintain both.
+    Migration(
+        "add_job_status_created_index",
+        _create_index("job", "idx_job_status_created", "status, created_at, job_id"),
+    ),
+    Migration(
+        "add_job_status_updated_index",
+        _create_index("job", "idx_job_status_updated", "status, updated_at, job_id"),
+    ),
+    Migration("drop_job_status_index", _drop_index("job_status")),
 )
 
 
@@ -5,13 +5,14 @@ Concrete implementations live in `in_memory_repository.py` and
 `sqlite_repository.py`; this module owns only the contract.
 """
 
+import base64
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 from src.models.cv_attempt import CVCompositionAttempt
-from src.models.unified import JobRecord
+from src.models.unified import JobRecord, JobRecordSummary
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,48 @@ def _unlink_pdfs(paths: list[str], job_id: str) -> None:
             logger.warning("Failed to unlink PDF %s for job %s: %s", raw, job_id, exc)
 
 
+# Keyset pagination position: the sort timestamp and job_id of the last row on
+# the previous page. job_id breaks ties between rows sharing a timestamp.
+Cursor = tuple[datetime, str]
+
+
+def encode_cursor(ts: datetime, job_id: str) -> str:
+    """Serialize a keyset position into an opaque, URL-safe cursor string."""
+    raw = f"{ts.isoformat()}|{job_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Inverse of ``encode_cursor``. Raises ValueError on a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts_raw, job_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        ts = datetime.fromisoformat(ts_raw)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts, job_id
+
+
+def next_cursor(jobs: list[JobRecord], order_by: str = "created_at") -> str | None:
+    """Cursor for the page after ``jobs``, or None when ``jobs`` is empty.
+
+    ``order_by`` must match the column the page was sorted on
+    (``get_history`` sorts on ``updated_at``).
+    """
+    if not jobs:
+        return None
+    last = jobs[-1]
+    return encode_cursor(getattr(last, order_by), last.job_id)
+
+
+def _check_pagination(method: str, offset: int, after: Cursor | None) -> None:
+    """Reject calls that mix offset and cursor pagination."""
+    if offset and after is not None:
+        raise ValueError(f"{method}: pass either offset or after, not both")
+
+
 UPDATABLE_FIELDS = frozenset({
     "status",
     "workflow_step",
@@ -102,6 +145,15 @@ class JobRepository(ABC):
     async def update(self, job_id: str, updates: dict) -> None:
         pass
 
+    @abstractmethod
+    async def update_many(self, patches: list[tuple[str, dict]]) -> None:
+        """Apply ``(job_id, updates)`` patches in order, all-or-nothing.
+
+        Every touched job gets the same ``updated_at``. Status changes are
+        validated in sequence, so one job may appear more than once.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, job_id: str) -> bool:
         pass
@@ -142,11 +194,23 @@ class JobRepository(ABC):
         offset: int = 0,
         order_by: str = "created_at",
         order_desc: bool = True,
+        after: Cursor | None = None,
     ) -> list[JobRecord]:
+        """Jobs in ``status`` sorted on ``order_by`` (ties broken by job_id).
+
+        Page with ``after`` (the position of the previous page's last row, see
+        ``next_cursor``) or with ``offset``, but not both.
+        """
         pass
 
     @abstractmethod
-    async def get_all(self, user_id: str, limit: int = 100, offset: int = 0) -> list[JobRecord]:
+    async def get_all(
+        self,
+        user_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Cursor | None = None,
+    ) -> list[JobRecord]:
         pass
 
     @abstractmethod
@@ -155,7 +219,20 @@ class JobRepository(ABC):
         user_id: str,
         limit: int = 50,
         statuses: list[str] | None = None,
+        after: Cursor | None = None,
     ) -> list[JobRecord]:
+        """Most recently updated jobs first; ``after`` is an ``updated_at`` cursor."""
+        pass
+
+    @abstractmethod
+    async def get_history_summaries(
+        self,
+        user_id: str,
+        limit: int = 50,
+        statuses: list[str] | None = None,
+        after: Cursor | None = None,
+    ) -> list[JobRecordSummary]:
+        """Same page as ``get_history``, projected to ``JobRecordSummary``."""
         pass
 
     @abstractmethod
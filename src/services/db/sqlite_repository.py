@@ -4,21 +4,83 @@ Schema migrations live in `migrations.py`. Cross-user admin reporting queries
 live in `sqlite_admin_queries.py` and are mixed into this class.
 """
 
-import json
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import aiosqlite
+import orjson
+
 from src.models.cv_attempt import CVCompositionAttempt
 from src.models.state_machine import BusinessState, WorkflowStep, validate_transition
-from src.models.unified import JobRecord
+from src.models.unified import JobRecord, JobRecordSummary
 
 from .migrations import apply_migrations
-from .repository import UPDATABLE_FIELDS, JobRepository, RepositoryError, _unlink_pdfs
+from .repository import (
+    UPDATABLE_FIELDS,
+    Cursor,
+    JobRepository,
+    RepositoryError,
+    _check_pagination,
+    _unlink_pdfs,
+)
 from .sqlite_admin_queries import SQLiteAdminQueriesMixin
 
 logger = logging.getLogger(__name__)
 
+# Column order of _job_record_to_row; create() binds positionally against it.
+_JOB_COLUMNS: tuple[str, ...] = (
+    "job_id", "user_id", "source", "mode", "status", "job_posting", "raw_input",
+    "current_cv_json", "current_pdf_path", "application_url", "filter_result",
+    "decline_reason", "override_reason", "refine_signal_state", "error_message",
+    "scrape_attempts", "last_scrape_error", "last_scrape_attempt_at",
+    "session_authenticated", "recovery_attempts", "last_recovery_attempt_at",
+    "workflow_step", "created_at", "updated_at",
+)
+_JOB_JSON_COLUMNS = frozenset({"job_posting", "raw_input", "current_cv_json", "filter_result"})
+
+# Hot single-row lookups run on a dedicated aiosqlite connection with fixed SQL
+# text, so sqlite3's statement cache reuses the prepared statement.
+_GET_JOB_SQL = "SELECT * FROM job WHERE job_id = ?"
+_FIND_BY_URL_SQL = "SELECT * FROM job WHERE application_url = ? LIMIT 1"
+_FIND_BY_URL_FOR_USER_SQL = (
+    "SELECT * FROM job WHERE application_url = ? AND user_id = ? LIMIT 1"
+)
+
+
+# Per-connection tuning for the read connection. journal_mode=WAL is persisted
+# in the database file, so it is set once in initialize() and then applies to
+# Piccolo's short-lived connections too; in WAL mode synchronous=NORMAL is
+# still crash-safe. The remaining PRAGMAs are connection-scoped and Piccolo
+# opens a fresh connection per write, so they are only worth paying for on
+# the long-lived read connection.
+_READ_CONN_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
+
+def _dict_row(cursor, row: tuple) -> dict:
+    return {col[0]: value for col, value in zip(cursor.description, row, strict=True)}
+
+
+# Piccolo Job.raw() placeholders are ``{}``.
+# List views read title/company out of the posting with json_extract so the
+# JSON blobs never leave SQLite.
+_SUMMARY_SELECT_SQL = (
+    "SELECT job_id, user_id, source, status, application_url, "
+    "json_extract(job_posting, '$.title') AS job_title, "
+    "json_extract(job_posting, '$.company') AS company, "
+    "created_at, updated_at FROM job"
+)
+_INSERT_JOB_SQL = (
+    f"INSERT INTO job ({', '.join(_JOB_COLUMNS)}) "
+    f"VALUES ({', '.join('{}' for _ in _JOB_COLUMNS)}) "
+    "ON CONFLICT (job_id) DO NOTHING RETURNING job_id"
+)
+
 
 class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
     """SQLite implementation of JobRepository using Piccolo ORM.
@@ -31,6 +93,13 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         self.db_path = db_path
         self._initialized: bool = False
         self._engine = None
+        # Per-repository subclasses of the Job/CVAttempt tables bound to this
+        # repository's engine (built in initialize(): Piccolo stays a lazy
+        # import because the in-memory backend never needs it). Two
+        # repositories on different files can then coexist in one process.
+        self._job_table = None
+        self._cv_attempt_table = None
+        self._read_conn: aiosqlite.Connection | None = None
 
     # =========================================================================
     # Lifecycle Methods
@@ -53,8 +122,15 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
         self._engine = SQLiteEngine(path=self.db_path)
 
-        Job._meta._db = self._engine
-        CVAttemptTable._meta._db = self._engine
+        # Piccolo copies inherited columns onto the subclass, so the shared
+        # Job/CVAttemptTable classes are left untouched.
+        self._job_table = type("Job", (Job,), {}, tablename="job", db=self._engine)
+        self._cv_attempt_table = type(
+            "CVAttemptTable", (CVAttemptTable,), {}, tablename="cv_attempt", db=self._engine
+        )
+
+        # User-side tables are shared with UserRepository and friends, which
+        # rely on this binding when they run against the same database.
         UserTable._meta._db = self._engine
         MagicLinkTable._meta._db = self._engine
         NotificationTable._meta._db = self._engine
@@ -62,12 +138,18 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         try:
             await UserTable.create_table(if_not_exists=True).run()
             await MagicLinkTable.create_table(if_not_exists=True).run()
-            await Job.create_table(if_not_exists=True).run()
-            await CVAttemptTable.create_table(if_not_exists=True).run()
+            await self._job_table.create_table(if_not_exists=True).run()
+            await self._cv_attempt_table.create_table(if_not_exists=True).run()
             await NotificationTable.create_table(if_not_exists=True).run()
 
             await apply_migrations(self._engine)
 
+            self._read_conn = await aiosqlite.connect(self.db_path)
+            self._read_conn.row_factory = _dict_row
+            await self._read_conn.execute("PRAGMA journal_mode=WAL")
+            for pragma in _READ_CONN_PRAGMAS:
+                await self._read_conn.execute(f"PRAGMA {pragma}")
+
             logger.info(f"SQLite repository initialized at {self.db_path}")
             self._initialized = True
         except Exception as e:
@@ -75,6 +157,9 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
             raise RepositoryError(f"Database initialization failed: {e}") from e
 
     async def close(self) -> None:
+        if self._read_conn is not None:
+            await self._read_conn.close()
+            self._read_conn = None
         if self._engine:
             await self._engine.close_connection_pool()
             self._engine = None
@@ -85,6 +170,11 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         if not self._initialized:
             raise RepositoryError("Repository not initialized. Call initialize() first.")
 
+    async def _fetch_one(self, sql: str, params: tuple) -> dict | None:
+        """Run a single-row lookup on the read connection, bypassing Piccolo."""
+        async with self._read_conn.execute(sql, params) as cursor:
+            return await cursor.fetchone()
+
     # =========================================================================
     # Conversion Helpers
     # =========================================================================
@@ -95,7 +185,7 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
             "user_id": job.user_id,
             "source": job.source,
             "mode": job.mode,
-            "status": job.status,
+            "status": str(job.status),
             "job_posting": job.job_posting,
             "raw_input": job.raw_input,
             "current_cv_json": job.current_cv_json,
@@ -122,8 +212,8 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
             return None
         if isinstance(value, dict):
             return value
-        if isinstance(value, str):
-            return json.loads(value)
+        if isinstance(value, (str, bytes)):
+            return orjson.loads(value)
         return value
 
     def _normalize_datetime(self, dt) -> datetime | None:
@@ -136,12 +226,15 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         return dt
 
     def _row_to_job_record(self, row: dict) -> JobRecord:
-        return JobRecord(
+        # Rows were validated as JobRecords on the way in, so skip Pydantic
+        # validation and do the few coercions it would have done by hand.
+        session_authenticated = row.get("session_authenticated")
+        return JobRecord.model_construct(
             job_id=row["job_id"],
-            user_id=row.get("user_id", ""),
+            user_id=row.get("user_id") or "",
             source=row["source"],
             mode=row["mode"],
-            status=row["status"],
+            status=BusinessState(row["status"]),
             job_posting=self._parse_json_field(row.get("job_posting")),
             raw_input=self._parse_json_field(row.get("raw_input")),
             current_cv_json=self._parse_json_field(row.get("current_cv_json")),
@@ -155,7 +248,9 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
             scrape_attempts=row.get("scrape_attempts") or 0,
             last_scrape_error=row.get("last_scrape_error"),
             last_scrape_attempt_at=self._normalize_datetime(row.get("last_scrape_attempt_at")),
-            session_authenticated=row.get("session_authenticated"),
+            session_authenticated=(
+                None if session_authenticated is None else bool(session_authenticated)
+            ),
             recovery_attempts=row.get("recovery_attempts") or 0,
             last_recovery_attempt_at=self._normalize_datetime(row.get("last_recovery_attempt_at")),
             workflow_step=WorkflowStep(row["workflow_step"]) if row.get("workflow_step") else None,
@@ -163,6 +258,19 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
             updated_at=self._normalize_datetime(row.get("updated_at")) or datetime.now(tz=timezone.utc),
         )
 
+    def _row_to_record_summary(self, row: dict) -> JobRecordSummary:
+        return JobRecordSummary.model_construct(
+            job_id=row["job_id"],
+            user_id=row.get("user_id") or "",
+            source=row["source"],
+            status=BusinessState(row["status"]),
+            job_title=row.get("job_title"),
+            company=row.get("company"),
+            application_url=row.get("application_url"),
+            created_at=self._normalize_datetime(row.get("created_at")),
+            updated_at=self._normalize_datetime(row.get("updated_at")),
+        )
+
     def _cv_attempt_to_row(self, attempt: CVCompositionAttempt) -> dict:
         return {
             "job_id": attempt.job_id,
@@ -191,40 +299,48 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def create(self, job: JobRecord) -> str:
         self._ensure_initialized()
-        from .tables import Job
-
-        existing = await Job.select().where(Job.job_id == job.job_id).first().run()
-        if existing:
-            raise RepositoryError(f"Job already exists: {job.job_id}", job.job_id)
+        table = self._job_table
 
+        # Raw statement: skips building a throwaway Piccolo Job instance and
+        # the per-insert query compilation. JSON columns are serialised here
+        # the way Piccolo's JSON column would; datetimes go through the
+        # sqlite3 adapters Piccolo registers.
         row_data = self._job_record_to_row(job)
-        await Job.insert(Job(**row_data)).run()
+        values = [
+            orjson.dumps(row_data[col], default=str).decode()
+            if col in _JOB_JSON_COLUMNS and row_data[col] is not None
+            else row_data[col]
+            for col in _JOB_COLUMNS
+        ]
+        inserted = await table.raw(_INSERT_JOB_SQL, *values).run()
+        if not inserted:
+            raise RepositoryError(f"Job already exists: {job.job_id}", job.job_id)
 
         logger.debug(f"Created job {job.job_id}")
         return job.job_id
 
     async def get(self, job_id: str) -> JobRecord | None:
         self._ensure_initialized()
-        from .tables import Job
 
-        row = await Job.select().where(Job.job_id == job_id).first().run()
+        row = await self._fetch_one(_GET_JOB_SQL, (job_id,))
         if not row:
             return None
         return self._row_to_job_record(row)
 
     async def update(self, job_id: str, updates: dict) -> None:
         self._ensure_initialized()
-        from .tables import Job
-
-        existing = await Job.select().where(Job.job_id == job_id).first().run()
-        if not existing:
-            raise RepositoryError(f"Job not found: {job_id}", job_id)
+        table = self._job_table
 
         invalid_fields = set(updates.keys()) - UPDATABLE_FIELDS
         if invalid_fields:
             raise ValueError(f"Invalid update fields: {invalid_fields}")
 
         if "status" in updates:
+            # Transition validation needs the current status; every other
+            # update is a single UPDATE ... RETURNING.
+            existing = await table.select(table.status).where(table.job_id == job_id).first().run()
+            if not existing:
+                raise RepositoryError(f"Job not found: {job_id}", job_id)
             current_status = existing["status"]
             new_status = updates["status"]
             if not isinstance(current_status, BusinessState):
@@ -235,45 +351,82 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
         updates["updated_at"] = datetime.now(tz=timezone.utc)
 
-        update_query = Job.update(updates).where(Job.job_id == job_id)
-        await update_query.run()
+        updated = await (
+            table.update(updates).where(table.job_id == job_id).returning(table.job_id).run()
+        )
+        if not updated:
+            raise RepositoryError(f"Job not found: {job_id}", job_id)
 
         logger.debug(f"Updated job {job_id}: {list(updates.keys())}")
 
+    async def update_many(self, patches: list[tuple[str, dict]]) -> None:
+        self._ensure_initialized()
+        table = self._job_table
+
+        for _, updates in patches:
+            invalid_fields = set(updates.keys()) - UPDATABLE_FIELDS
+            if invalid_fields:
+                raise ValueError(f"Invalid update fields: {invalid_fields}")
+
+        job_ids = list(dict.fromkeys(job_id for job_id, _ in patches))
+        if not job_ids:
+            return
+
+        now = datetime.now(tz=timezone.utc)
+        async with table._meta.db.transaction():
+            rows = await table.select(table.job_id, table.status).where(table.job_id.is_in(job_ids)).run()
+            statuses = {row["job_id"]: row["status"] for row in rows}
+            for job_id, updates in patches:
+                if job_id not in statuses:
+                    raise RepositoryError(f"Job not found: {job_id}", job_id)
+                if "status" in updates:
+                    current_status = statuses[job_id]
+                    new_status = updates["status"]
+                    if not isinstance(current_status, BusinessState):
+                        current_status = BusinessState(current_status)
+                    if not isinstance(new_status, BusinessState):
+                        new_status = BusinessState(new_status)
+                    validate_transition(current_status, new_status, job_id)
+                    statuses[job_id] = new_status
+
+            for job_id, updates in patches:
+                updates["updated_at"] = now
+                await table.update(updates).where(table.job_id == job_id).run()
+
+        logger.debug(f"Updated {len(patches)} patch(es) across {len(job_ids)} job(s)")
+
     async def delete(self, job_id: str) -> bool:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
-        existing = await Job.select().where(Job.job_id == job_id).first().run()
-        if not existing:
+        deleted = await table.delete().where(table.job_id == job_id).returning(table.job_id).run()
+        if not deleted:
             return False
-
-        await Job.delete().where(Job.job_id == job_id).run()
         logger.debug(f"Deleted job {job_id}")
         return True
 
     async def try_claim_failed_for_retry(self, job_id: str) -> JobRecord | None:
         """Atomic FAILED → QUEUED claim (SQLite, multi-worker safe)."""
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
-        async with Job._meta.db.transaction():
-            existing = await Job.select().where(Job.job_id == job_id).first().run()
+        async with table._meta.db.transaction():
+            existing = await table.select().where(table.job_id == job_id).first().run()
             if not existing:
                 return None
             if existing.get("status") != BusinessState.FAILED.value:
                 return None
             await (
-                Job.update(
+                table.update(
                     {
-                        Job.status: BusinessState.QUEUED.value,
-                        Job.error_message: None,
-                        Job.last_scrape_error: None,
-                        Job.updated_at: datetime.now(tz=timezone.utc),
+                        table.status: BusinessState.QUEUED.value,
+                        table.error_message: None,
+                        table.last_scrape_error: None,
+                        table.updated_at: datetime.now(tz=timezone.utc),
                     }
                 )
-                .where(Job.job_id == job_id)
-                .where(Job.status == BusinessState.FAILED.value)
+                .where(table.job_id == job_id)
+                .where(table.status == BusinessState.FAILED.value)
                 .run()
             )
 
@@ -281,12 +434,12 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def delete_for_user(self, job_id: str, user_id: str) -> bool:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
         existing = (
-            await Job.select()
-            .where(Job.job_id == job_id)
-            .where(Job.user_id == user_id)
+            await table.select()
+            .where(table.job_id == job_id)
+            .where(table.user_id == user_id)
             .first()
             .run()
         )
@@ -296,11 +449,11 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def delete_cascade(self, job_id: str) -> bool:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
         existing = (
-            await Job.select()
-            .where(Job.job_id == job_id)
+            await table.select()
+            .where(table.job_id == job_id)
             .first()
             .run()
         )
@@ -309,11 +462,11 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         return await self._cascade_delete_existing(job_id, existing)
 
     async def _cascade_delete_existing(self, job_id: str, existing: dict) -> bool:
-        from .tables import CVAttemptTable, Job
+        table, attempts = self._job_table, self._cv_attempt_table
 
         attempt_rows = (
-            await CVAttemptTable.select(CVAttemptTable.pdf_path)
-            .where(CVAttemptTable.job_id == job_id)
+            await attempts.select(attempts.pdf_path)
+            .where(attempts.job_id == job_id)
             .run()
         )
 
@@ -325,9 +478,9 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
                 pdf_paths.append(row["pdf_path"])
 
         # Atomic so a mid-step failure can't orphan the job from its history.
-        async with Job._meta.db.transaction():
-            await CVAttemptTable.delete().where(CVAttemptTable.job_id == job_id).run()
-            await Job.delete().where(Job.job_id == job_id).run()
+        async with table._meta.db.transaction():
+            await attempts.delete().where(attempts.job_id == job_id).run()
+            await table.delete().where(table.job_id == job_id).run()
         logger.info("Cascade-deleted job %s (%d pdfs)", job_id, len(pdf_paths))
 
         _unlink_pdfs(pdf_paths, job_id)
@@ -339,12 +492,12 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def get_for_user(self, job_id: str, user_id: str) -> JobRecord | None:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
         row = (
-            await Job.select()
-            .where(Job.job_id == job_id)
-            .where(Job.user_id == user_id)
+            await table.select()
+            .where(table.job_id == job_id)
+            .where(table.user_id == user_id)
             .first()
             .run()
         )
@@ -354,13 +507,13 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def get_pending(self, user_id: str) -> list[JobRecord]:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
         rows = (
-            await Job.select()
-            .where(Job.status == BusinessState.PENDING)
-            .where(Job.user_id == user_id)
-            .order_by(Job.created_at, ascending=False)
+            await table.select()
+            .where(table.status == BusinessState.PENDING)
+            .where(table.user_id == user_id)
+            .order_by(table.created_at, ascending=False)
             .run()
         )
 
@@ -374,37 +527,39 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         offset: int = 0,
         order_by: str = "created_at",
         order_desc: bool = True,
+        after: Cursor | None = None,
     ) -> list[JobRecord]:
         self._ensure_initialized()
-        from .tables import Job
+        _check_pagination("get_by_status", offset, after)
+        table = self._job_table
 
-        order_column = Job.updated_at if order_by == "updated_at" else Job.created_at
+        order_column = table.updated_at if order_by == "updated_at" else table.created_at
 
-        rows = (
-            await Job.select()
-            .where(Job.status == status)
-            .where(Job.user_id == user_id)
-            .order_by(order_column, ascending=not order_desc)
-            .limit(limit)
-            .offset(offset)
-            .run()
+        query = (
+            table.select()
+            .where(table.status == status)
+            .where(table.user_id == user_id)
         )
+        query = self._keyset(query, order_column, order_desc, limit, offset, after)
 
+        rows = await query.run()
         return [self._row_to_job_record(row) for row in rows]
 
-    async def get_all(self, user_id: str, limit: int = 100, offset: int = 0) -> list[JobRecord]:
+    async def get_all(
+        self,
+        user_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: Cursor | None = None,
+    ) -> list[JobRecord]:
         self._ensure_initialized()
-        from .tables import Job
+        _check_pagination("get_all", offset, after)
+        table = self._job_table
 
-        rows = (
-            await Job.select()
-            .where(Job.user_id == user_id)
-            .order_by(Job.created_at, ascending=False)
-            .limit(limit)
-            .offset(offset)
-            .run()
-        )
+        query = table.select().where(table.user_id == user_id)
+        query = self._keyset(query, table.created_at, True, limit, offset, after)
 
+        rows = await query.run()
         return [self._row_to_job_record(row) for row in rows]
 
     async def get_history(
@@ -412,23 +567,85 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         user_id: str,
         limit: int = 50,
         statuses: list[str] | None = None,
+        after: Cursor | None = None,
     ) -> list[JobRecord]:
-        self._ensure_initialized()
-        from .tables import Job
+        if statuses and len(statuses) == 1:
+            # status = ? rather than IN (?): guarantees the
+            # (user_id, status, updated_at) index is chosen.
+            return await self.get_by_status(
+                user_id, statuses[0], limit=limit, order_by="updated_at", after=after
+            )
 
-        query = (
-            Job.select()
-            .where(Job.user_id == user_id)
-            .order_by(Job.updated_at, ascending=False)
-            .limit(limit)
-        )
+        self._ensure_initialized()
+        table = self._job_table
 
+        query = table.select().where(table.user_id == user_id)
         if statuses:
-            query = query.where(Job.status.is_in(statuses))
+            query = query.where(table.status.is_in(statuses))
+        query = self._keyset(query, table.updated_at, True, limit, after=after)
 
         rows = await query.run()
         return [self._row_to_job_record(row) for row in rows]
 
+    async def get_history_summaries(
+        self,
+        user_id: str,
+        limit: int = 50,
+        statuses: list[str] | None = None,
+        after: Cursor | None = None,
+    ) -> list[JobRecordSummary]:
+        self._ensure_initialized()
+        table = self._job_table
+
+        sql = [_SUMMARY_SELECT_SQL, "WHERE user_id = {}"]
+        params: list = [user_id]
+        if statuses and len(statuses) == 1:
+            sql.append("AND status = {}")
+            params.append(str(statuses[0]))
+        elif statuses:
+            sql.append(f"AND status IN ({', '.join('{}' for _ in statuses)})")
+            params.extend(str(s) for s in statuses)
+        if after is not None:
+            ts, job_id = after
+            sql.append("AND (updated_at < {} OR (updated_at = {} AND job_id < {}))")
+            params.extend((ts, ts, job_id))
+        sql.append("ORDER BY updated_at DESC, job_id DESC LIMIT {}")
+        params.append(limit)
+
+        rows = await table.raw(" ".join(sql), *params).run()
+        return [self._row_to_record_summary(row) for row in rows]
+
+    def _keyset(
+        self,
+        query,
+        order_column,
+        order_desc: bool,
+        limit: int,
+        offset: int = 0,
+        after: Cursor | None = None,
+    ):
+        """Order on (order_column, job_id) and seek past ``after``.
+
+        The seek predicate lets SQLite start the index range scan at the cursor
+        instead of reading and discarding ``offset`` rows.
+        """
+        table = self._job_table
+
+        if after is not None:
+            ts, job_id = after
+            if order_desc:
+                query = query.where(
+                    (order_column < ts) | ((order_column == ts) & (table.job_id < job_id))
+                )
+            else:
+                query = query.where(
+                    (order_column > ts) | ((order_column == ts) & (table.job_id > job_id))
+                )
+        query = query.order_by(order_column, table.job_id, ascending=not order_desc).limit(limit)
+        if offset:
+            query = query.offset(offset)
+        return query
+
     async def list_by_states(
         self,
         states: list[str],
@@ -437,7 +654,7 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         limit: int = 200,
     ) -> list[JobRecord]:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
         if not states:
             return []
@@ -445,13 +662,13 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         state_values = [str(s) for s in states]
 
         query = (
-            Job.select()
-            .where(Job.status.is_in(state_values))
-            .order_by(Job.updated_at, ascending=False)
+            table.select()
+            .where(table.status.is_in(state_values))
+            .order_by(table.updated_at, ascending=False)
             .limit(limit)
         )
         if user_id is not None:
-            query = query.where(Job.user_id == user_id)
+            query = query.where(table.user_id == user_id)
 
         rows = await query.run()
         return [self._row_to_job_record(row) for row in rows]
@@ -479,13 +696,13 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         self, user_id: str, state: str, limit: int = 50
     ) -> list[JobRecord]:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
         rows = (
-            await Job.select()
-            .where(Job.user_id == user_id)
-            .where(Job.refine_signal_state == state)
-            .order_by(Job.updated_at, ascending=False)
+            await table.select()
+            .where(table.user_id == user_id)
+            .where(table.refine_signal_state == state)
+            .order_by(table.updated_at, ascending=False)
             .limit(limit)
             .run()
         )
@@ -493,18 +710,18 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def mark_refine_signals(self, job_ids: list[str], state: str) -> None:
         self._ensure_initialized()
-        from .tables import Job
+        table = self._job_table
 
         if not job_ids:
             return
         await (
-            Job.update(
+            table.update(
                 {
-                    Job.refine_signal_state: state,
-                    Job.updated_at: datetime.now(tz=timezone.utc),
+                    table.refine_signal_state: state,
+                    table.updated_at: datetime.now(tz=timezone.utc),
                 }
             )
-            .where(Job.job_id.is_in(job_ids))
+            .where(table.job_id.is_in(job_ids))
             .run()
         )
 
@@ -514,34 +731,34 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def create_cv_attempt(self, attempt: CVCompositionAttempt) -> None:
         self._ensure_initialized()
-        from .tables import CVAttemptTable
+        attempts = self._cv_attempt_table
 
         row_data = self._cv_attempt_to_row(attempt)
-        await CVAttemptTable.insert(CVAttemptTable(**row_data)).run()
+        await attempts.insert(attempts(**row_data)).run()
         logger.debug(
             f"Created CV attempt {attempt.attempt_number} for job {attempt.job_id}"
         )
 
     async def get_cv_attempts(self, job_id: str) -> list[CVCompositionAttempt]:
         self._ensure_initialized()
-        from .tables import CVAttemptTable
+        attempts = self._cv_attempt_table
 
         rows = (
-            await CVAttemptTable.select()
-            .where(CVAttemptTable.job_id == job_id)
-            .order_by(CVAttemptTable.attempt_number, ascending=True)
+            await attempts.select()
+            .where(attempts.job_id == job_id)
+            .order_by(attempts.attempt_number, ascending=True)
             .run()
         )
         return [self._row_to_cv_attempt(row) for row in rows]
 
     async def get_latest_cv_attempt(self, job_id: str) -> CVCompositionAttempt | None:
         self._ensure_initialized()
-        from .tables import CVAttemptTable
+        attempts = self._cv_attempt_table
 
         row = (
-            await CVAttemptTable.select()
-            .where(CVAttemptTable.job_id == job_id)
-            .order_by(CVAttemptTable.attempt_number, ascending=False)
+            await attempts.select()
+            .where(attempts.job_id == job_id)
+            .order_by(attempts.attempt_number, ascending=False)
             .first()
             .run()
         )
@@ -555,12 +772,11 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
     async def find_by_application_url(self, url: str, user_id: str | None = None) -> JobRecord | None:
         self._ensure_initialized()
-        from .tables import Job
 
-        query = Job.select().where(Job.application_url == url)
-        if user_id is not None:
-            query = query.where(Job.user_id == user_id)
-        row = await query.first().run()
+        if user_id is None:
+            row = await self._fetch_one(_FIND_BY_URL_SQL, (url,))
+        else:
+            row = await self._fetch_one(_FIND_BY_URL_FOR_USER_SQL, (url, user_id))
         if not row:
             return None
 
@@ -573,7 +789,7 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
         user_id: str | None = None,
     ) -> int:
         self._ensure_initialized()
-        from .tables import CVAttemptTable, Job
+        table, attempts = self._job_table, self._cv_attempt_table
 
         if older_than_days < 1:
             raise ValueError("older_than_days must be >= 1")
@@ -582,22 +798,27 @@ class SQLiteJobRepository(SQLiteAdminQueriesMixin, JobRepository):
 
         cutoff_date = datetime.now(tz=timezone.utc) - timedelta(days=older_than_days)
 
-        query = Job.select(Job.job_id).where(Job.status.is_in(statuses)).where(Job.created_at < cutoff_date)
+        query = (
+            table.delete()
+            .where(table.status.is_in(statuses))
+            .where(table.created_at < cutoff_date)
+            .returning(table.job_id)
+        )
         if user_id is not None:
-            query = query.where(Job.user_id == user_id)
-
-        to_delete = await query.run()
-        count = len(to_delete)
-
-        if count > 0:
-            job_ids = [row["job_id"] for row in to_delete]
-            async with Job._meta.db.transaction():
+            query = query.where(table.user_id == user_id)
+
+        # One DELETE ... RETURNING selects and removes the jobs; their CV
+        # attempts go in the same transaction.
+        async with table._meta.db.transaction():
+            deleted = await query.run()
+            if deleted:
+                job_ids = [row["job_id"] for row in deleted]
                 await (
-                    CVAttemptTable.delete()
-                    .where(CVAttemptTable.job_id.is_in(job_ids))
+                    attempts.delete()
+                    .where(attempts.job_id.is_in(job_ids))
                     .run()
                 )
-                await Job.delete().where(Job.job_id.is_in(job_ids)).run()
+        count = len(deleted)
 
         logger.info(f"Cleanup: deleted {count} jobs older than {older_than_days} days")
         return count
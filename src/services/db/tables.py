@@ -62,7 +62,9 @@ class Job(Table):
     # Metadata
     source = Varchar(length=20)  # url, manual, linkedin
     mode = Varchar(length=10)  # mvp, full
-    status = Varchar(length=30, index=True)  # queued, pending, applied, etc.
+    # queued, pending, applied, etc. Indexed by the composite status indexes
+    # in migrations.py rather than a single-column index.
+    status = Varchar(length=30)
 
     # Job data (JSON TEXT columns)
     job_posting = JSON(null=True)
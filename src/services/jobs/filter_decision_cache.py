@@ -0,0 +1,79 @@
+"""In-process cache for LLM job-filter decisions.
+
+A filter evaluation is a pure function of what the prompt shows the model:
+the posting (title, company, location, description), the user's criteria
+section, and the model itself. LinkedIn re-surfaces the same posting under new
+job ids and the recovery path re-runs filtering on jobs that were already
+scored, so identical inputs are evaluated more than once. Descriptions are
+normalised the same way as for ``JobSummaryCache`` so scrape-to-scrape
+whitespace/case noise still hits.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from src.models.job_filter import FilterResult
+from src.services.cv.job_summary_cache import normalize_job_description
+
+
+class FilterDecisionCache:
+    """Bounded, thread-safe LRU of ``FilterResult`` objects.
+
+    ``JobFilter`` runs inside ``asyncio.to_thread`` (one thread per workflow
+    or per batch), hence the lock. Results are deep-copied on the way out so
+    callers may mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, FilterResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, criteria: str, job_posting: dict[str, Any]) -> bytes:
+        """Return the cache key for ``job_posting`` judged by ``model`` against
+        the rendered user ``criteria`` section."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            model,
+            criteria,
+            str(job_posting.get("title", "")).strip().casefold(),
+            str(job_posting.get("company", "")).strip().casefold(),
+            str(job_posting.get("location", "")).strip().casefold(),
+            normalize_job_description(str(job_posting.get("description", ""))),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.digest()
+
+    def get(self, key: bytes) -> FilterResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result.model_copy(deep=True)
+
+    def put(self, key: bytes, result: FilterResult) -> None:
+        with self._lock:
+            self._entries[key] = result.model_copy(deep=True)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -179,18 +179,14 @@ class HITLProcessor:
         """Get application history for a user with optional status filter."""
         try:
             statuses = [status] if status else None
-            jobs = await self._ctx.repository.get_history(
+            jobs = await self._ctx.repository.get_history_summaries(
                 user_id=user_id, limit=limit, statuses=statuses
             )
             return [
                 ApplicationHistoryItem(
                     job_id=job.job_id,
-                    job_title=job.job_posting.get("title")
-                    if job.job_posting
-                    else None,
-                    company=job.job_posting.get("company")
-                    if job.job_posting
-                    else None,
+                    job_title=job.job_title,
+                    company=job.company,
                     status=job.status,
                     created_at=job.created_at,
                 )
@@ -18,6 +18,7 @@ from src.llm.prompt_spec import PromptSpec
 from src.llm.provider import BaseLLMClient
 from src.models.job_filter import FilterRefinement, FilterResult, UserFilterPreferences
 from src.services.cv.cv_prompts import PromptLoader
+from src.services.jobs.filter_decision_cache import FilterDecisionCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +44,13 @@ class JobFilter:
         self,
         llm_client: BaseLLMClient,
         prompts_dir: str | None = None,
+        decision_cache: FilterDecisionCache | None = None,
     ):
         self.llm = llm_client
         self.prompts = PromptLoader(prompts_dir or DEFAULT_PROMPTS_DIR)
+        # Optional shared cache: identical postings judged against the same
+        # criteria by the same model skip the LLM call.
+        self.decision_cache = decision_cache
 
     def evaluate_job(
         self,
@@ -72,6 +77,27 @@ class JobFilter:
         Raises:
             JobFilterError: If LLM call or result parsing fails.
         """
+        key = self._decision_key(job_posting, user_filter_prefs)
+        if key is not None:
+            cached = self.decision_cache.get(key)
+            if cached is not None:
+                logger.info(
+                    f"Reusing filter decision for {job_posting.get('title', 'N/A')} "
+                    f"at {job_posting.get('company', 'N/A')}: score={cached.score}"
+                )
+                return cached
+
+        result = self._evaluate_single(job_posting, user_filter_prefs, user_id)
+        if key is not None:
+            self.decision_cache.put(key, result)
+        return result
+
+    def _evaluate_single(
+        self,
+        job_posting: dict[str, Any],
+        user_filter_prefs: UserFilterPreferences | None,
+        user_id: str,
+    ) -> FilterResult:
         job_title = job_posting.get("title", "N/A")
         company = job_posting.get("company", "N/A")
         logger.info(f"Evaluating job: {job_title} at {company}")
@@ -95,6 +121,17 @@ class JobFilter:
         )
         return result
 
+    def _decision_key(
+        self,
+        job_posting: dict[str, Any],
+        user_filter_prefs: UserFilterPreferences | None,
+    ) -> bytes | None:
+        if self.decision_cache is None:
+            return None
+        return FilterDecisionCache.make_key(
+            self.llm.model, self._user_criteria_section(user_filter_prefs), job_posting
+        )
+
     def generate_prompt_from_preferences(
         self,
         natural_language_prefs: str,
@@ -227,22 +264,10 @@ class JobFilter:
         Uses ``custom_prompt`` (generated criteria) if set, otherwise falls
         back to ``natural_language_prefs`` as a simple criteria section.
         """
-        user_criteria_section = ""
-        if user_filter_prefs and user_filter_prefs.custom_prompt:
-            user_criteria_section = (
-                "User-Specific Criteria (apply IN ADDITION to the checks below):\n\n"
-                f"{user_filter_prefs.custom_prompt}"
-            )
-        elif user_filter_prefs and user_filter_prefs.natural_language_prefs:
-            user_criteria_section = (
-                "User Preferences (use these to adjust scoring):\n"
-                f"{user_filter_prefs.natural_language_prefs}"
-            )
-
         return self.prompts.load_spec(
             "default_filter_prompt",
             cache_key=f"filter:{user_id}" if user_id else "",
-            system_vars={"user_criteria_section": user_criteria_section},
+            system_vars={"user_criteria_section": self._user_criteria_section(user_filter_prefs)},
             user_vars={
                 "job_title": job_posting.get("title", "N/A"),
                 "company": job_posting.get("company", "N/A"),
@@ -250,3 +275,19 @@ class JobFilter:
                 "description": job_posting.get("description", "N/A"),
             },
         )
+
+    @staticmethod
+    def _user_criteria_section(user_filter_prefs: UserFilterPreferences | None) -> str:
+        """User criteria for the static block: ``custom_prompt`` if set,
+        else ``natural_language_prefs``, else empty."""
+        if user_filter_prefs and user_filter_prefs.custom_prompt:
+            return (
+                "User-Specific Criteria (apply IN ADDITION to the checks below):\n\n"
+                f"{user_filter_prefs.custom_prompt}"
+            )
+        if user_filter_prefs and user_filter_prefs.natural_language_prefs:
+            return (
+                "User Preferences (use these to adjust scoring):\n"
+                f"{user_filter_prefs.natural_language_prefs}"
+            )
+        return ""
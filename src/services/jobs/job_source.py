@@ -11,7 +11,10 @@ Actual implementation will use HTTP + LLM structured output extraction.
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import partial
 from typing import Any
+from urllib.parse import urlparse
 
 
 class JobSourceAdapter(ABC):
@@ -89,14 +92,14 @@ class URLJobExtractor(JobSourceAdapter):
     4. Return normalized JobPosting dict
     """
 
-    SUPPORTED_DOMAINS = [
+    # Registrable domains; subdomains (jobs.lever.co, boards.greenhouse.io,
+    # <tenant>.myworkdayjobs.com) match via their suffix.
+    SUPPORTED_DOMAINS: frozenset[str] = frozenset({
         "lever.co",
-        "jobs.lever.co",
         "greenhouse.io",
-        "boards.greenhouse.io",
         "myworkday.com",
         "myworkdayjobs.com",
-    ]
+    })
 
     def __init__(self, llm_client: Any = None):
         """Initialize URL job extractor.
@@ -132,8 +135,12 @@ class URLJobExtractor(JobSourceAdapter):
 
     def _is_supported_domain(self, url: str) -> bool:
         """Check if URL is from a supported job board domain."""
-        # TODO: Implement domain checking
-        return True
+        host = (urlparse(url).hostname or "").rstrip(".")
+        labels = host.split(".")
+        # One set lookup per parent domain of the host, bare TLD excluded.
+        return any(
+            ".".join(labels[i:]) in self.SUPPORTED_DOMAINS for i in range(len(labels) - 1)
+        )
 
 
 class ManualJobAdapter(JobSourceAdapter):
@@ -143,6 +150,8 @@ class ManualJobAdapter(JobSourceAdapter):
     No external fetching required.
     """
 
+    _REQUIRED_FIELDS = frozenset({"title", "company", "description"})
+
     async def extract(self, raw_input: dict[str, Any]) -> dict[str, Any]:
         """Normalize manual job description input.
 
@@ -171,8 +180,7 @@ class ManualJobAdapter(JobSourceAdapter):
 
     def can_handle(self, raw_input: dict[str, Any]) -> bool:
         """Check if input contains manual job description fields."""
-        required_fields = {"title", "company", "description"}
-        return required_fields.issubset(raw_input.keys())
+        return self._REQUIRED_FIELDS.issubset(raw_input)
 
 
 class LinkedInJobAdapter(JobSourceAdapter):
@@ -282,11 +290,15 @@ class JobSourceFactory:
             llm_client: LLM client for adapters that need it.
         """
         self.llm_client = llm_client
-        self._adapters = {
-            "url": URLJobExtractor(llm_client=llm_client),
-            "manual": ManualJobAdapter(),
-            "linkedin": LinkedInJobAdapter(),
+        # Adapters are built on first use; a workflow normally needs just one.
+        # Insertion order is the auto-detection order: first adapter whose
+        # can_handle() matches wins.
+        self._factories: dict[str, Callable[[], JobSourceAdapter]] = {
+            "url": partial(URLJobExtractor, llm_client=llm_client),
+            "manual": ManualJobAdapter,
+            "linkedin": LinkedInJobAdapter,
         }
+        self._adapters: dict[str, JobSourceAdapter] = {}
 
     def get_adapter(self, source_type: str) -> JobSourceAdapter:
         """Get adapter for the given source type.
@@ -300,12 +312,15 @@ class JobSourceFactory:
         Raises:
             ValueError: If source_type is not recognized.
         """
-        if source_type not in self._adapters:
-            raise ValueError(
-                f"Unknown source type: {source_type}. "
-                f"Supported: {list(self._adapters.keys())}"
-            )
-        return self._adapters[source_type]
+        adapter = self._adapters.get(source_type)
+        if adapter is None:
+            if source_type not in self._factories:
+                raise ValueError(
+                    f"Unknown source type: {source_type}. "
+                    f"Supported: {list(self._factories.keys())}"
+                )
+            adapter = self._adapters[source_type] = self._factories[source_type]()
+        return adapter
 
     def get_adapter_for_input(self, raw_input: dict[str, Any]) -> JobSourceAdapter:
         """Auto-detect and return appropriate adapter for input.
@@ -319,7 +334,8 @@ class JobSourceFactory:
         Raises:
             ValueError: If no adapter can handle the input.
         """
-        for adapter in self._adapters.values():
+        for source_type in self._factories:
+            adapter = self.get_adapter(source_type)
             if adapter.can_handle(raw_input):
                 return adapter
         raise ValueError(
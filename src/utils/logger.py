@@ -1,6 +1,9 @@
 """Logging configuration"""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +16,26 @@ DEFAULT_LOG_DIR = PROJECT_ROOT / "logs"
 _RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` once per wall-clock second.
+
+    The date format has second resolution, so every record within the same
+    second gets the same string; only the first pays for localtime/strftime.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cached_time = (second, text)
+        return text
+
+
 def setup_logger(
     name: str,
     level: str = "INFO",
@@ -38,7 +61,7 @@ def setup_logger(
     logger.setLevel(getattr(logging, level.upper()))
 
     # Formatter with timestamp
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         "[%(asctime)s] %(levelname)s [%(name)s.%(funcName)s:%(lineno)d] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
@@ -47,7 +70,7 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler (optional)
     if log_file:
@@ -57,7 +80,17 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(getattr(logging, level.upper()))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Log calls only enqueue the record; a listener thread does the formatting
+    # and the blocking console/file writes, off the request path.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drains queued records on shutdown
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.listener = listener  # same attribute dictConfig sets on 3.12+
+    logger.addHandler(queue_handler)
 
     return logger
 
@@ -1,10 +1,29 @@
 """Schema compliance guardrail for CV validation"""
 
-import json
-
 from deepeval.metrics import BaseMetric
 from deepeval.test_case import LLMTestCase
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from src.models.cv import CV, ContactInfo, Education, Experience, Project, Skill
+
+# Section name -> model; list sections validate through a TypeAdapter built once
+_SECTION_MODELS = {
+    "experiences": Experience,
+    "education": Education,
+    "skills": Skill,
+    "projects": Project,
+    "contact": ContactInfo,
+}
+_SECTION_LIST_ADAPTERS = {
+    name: TypeAdapter(list[model])
+    for name, model in _SECTION_MODELS.items()
+    if name != "contact"
+}
+
+
+def _is_json_error(error: ValidationError) -> bool:
+    """True when validate_json failed on malformed JSON rather than the schema"""
+    return any(err["type"] == "json_invalid" for err in error.errors())
 
 
 class CVSchemaComplianceGuard(BaseMetric):
@@ -41,32 +60,28 @@ class CVSchemaComplianceGuard(BaseMetric):
             1.0 if schema validation passes
             0.0 if validation fails
         """
-        from src.models.cv import CV
-
         try:
-            # Parse CV data
+            # Validate against Pydantic model; JSON text is parsed and validated
+            # in a single pass by pydantic-core, without building dicts first
             if isinstance(test_case.actual_output, str):
-                cv_data = json.loads(test_case.actual_output)
+                CV.model_validate_json(test_case.actual_output)
             elif isinstance(test_case.actual_output, dict):
-                cv_data = test_case.actual_output
+                CV.model_validate(test_case.actual_output)
             else:
                 raise ValueError(f"Unsupported actual_output type: {type(test_case.actual_output)}")
 
-            # Validate against Pydantic model
-            CV(**cv_data)
-
             # Success - CV matches schema
             self.score = 1.0
             self.reason = "CV matches Pydantic schema. All required fields present and valid."
             self.success = True
 
-        except json.JSONDecodeError as e:
-            self.score = 0.0
-            self.reason = f"JSON parsing failed: {str(e)}"
-            self.success = False
-
         except ValidationError as e:
             self.score = 0.0
+            if _is_json_error(e):
+                self.reason = f"JSON parsing failed: {e.errors()[0]['msg']}"
+                self.success = False
+                return self.score
+
             # Format validation errors nicely
             errors = []
             for error in e.errors():
@@ -129,61 +144,43 @@ class CVSectionSchemaGuard(BaseMetric):
         self.reason = ""
         self.success = False
 
-        # Map section names to Pydantic models
-        self.section_models = {
-            "experiences": "Experience",
-            "education": "Education",
-            "skills": "Skill",
-            "projects": "Project",
-            "contact": "ContactInfo",
-        }
-
-        if section_name not in self.section_models:
+        if section_name not in _SECTION_MODELS:
             raise ValueError(
                 f"Unknown section: {section_name}. "
-                f"Supported: {list(self.section_models.keys())}"
+                f"Supported: {list(_SECTION_MODELS.keys())}"
             )
+        self._model_class = _SECTION_MODELS[section_name]
+        self._list_adapter = _SECTION_LIST_ADAPTERS.get(section_name)
 
     def measure(self, test_case: LLMTestCase) -> float:
         """Validate section data against its schema"""
-        from src.models.cv import ContactInfo, Education, Experience, Project, Skill
-
-        model_map = {
-            "experiences": Experience,
-            "education": Education,
-            "skills": Skill,
-            "projects": Project,
-            "contact": ContactInfo,
-        }
-
-        model_class = model_map[self.section_name]
-
         try:
-            # Parse section data
-            if isinstance(test_case.actual_output, str):
-                section_data = json.loads(test_case.actual_output)
-            else:
-                section_data = test_case.actual_output
+            section_data = test_case.actual_output
+            is_json = isinstance(section_data, str)
 
             # Validate based on whether section is list or dict
-            if self.section_name == "contact":
+            if self._list_adapter is None:
                 # Contact is a single object
-                model_class(**section_data)
+                if is_json:
+                    self._model_class.model_validate_json(section_data)
+                else:
+                    self._model_class.model_validate(section_data)
                 count = 1
+            elif is_json:
+                # Most sections are lists; the adapter rejects non-list JSON
+                count = len(self._list_adapter.validate_json(section_data))
             else:
-                # Most sections are lists
                 if not isinstance(section_data, list):
                     raise ValueError(f"{self.section_name} must be a list, got {type(section_data)}")
 
-                for item in section_data:
-                    model_class(**item)
+                self._list_adapter.validate_python(section_data)
                 count = len(section_data)
 
             self.score = 1.0
             self.reason = f"{self.section_name.capitalize()} section valid ({count} items checked)"
             self.success = True
 
-        except (json.JSONDecodeError, ValidationError, ValueError) as e:
+        except (ValidationError, ValueError) as e:
             self.score = 0.0
             self.reason = f"{self.section_name.capitalize()} validation failed: {str(e)}"
             self.success = False
@@ -0,0 +1,54 @@
+"""Tests for the best-effort CV prompt pre-warm run at API startup."""
+
+import logging
+import sys
+from unittest.mock import MagicMock, patch
+
+from src.api.main import _prewarm_cv_prompts
+from src.api.main import logger as api_logger
+
+
+class TestPrewarmCvPrompts:
+    def test_missing_dir_is_not_created(self, tmp_path):
+        missing = tmp_path / "prompts" / "cv_composer"
+        shared = MagicMock()
+
+        with patch.dict(sys.modules, {"src.agents._shared": shared}):
+            _prewarm_cv_prompts(str(missing))
+
+        assert not missing.exists()
+        shared.get_cv_prompt_manager.assert_not_called()
+
+    def test_non_path_setting_is_skipped(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        shared = MagicMock()
+
+        with patch.dict(sys.modules, {"src.agents._shared": shared}):
+            _prewarm_cv_prompts(MagicMock())
+
+        assert list(tmp_path.iterdir()) == []
+        shared.get_cv_prompt_manager.assert_not_called()
+
+    def test_existing_dir_is_warmed(self, tmp_path):
+        shared = MagicMock()
+
+        with patch.dict(sys.modules, {"src.agents._shared": shared}):
+            _prewarm_cv_prompts(str(tmp_path))
+
+        shared.get_cv_prompt_manager.assert_called_once_with(str(tmp_path))
+
+    def test_failure_is_logged_not_raised(self, tmp_path, caplog):
+        shared = MagicMock()
+        shared.get_cv_prompt_manager.side_effect = FileNotFoundError("full_cv.system.txt")
+
+        with (
+            patch.dict(sys.modules, {"src.agents._shared": shared}),
+            caplog.at_level(logging.WARNING, logger=api_logger.name),
+        ):
+            assert _prewarm_cv_prompts(str(tmp_path)) is None
+
+        shared.get_cv_prompt_manager.assert_called_once_with(str(tmp_path))
+        [record] = [r for r in caplog.records if r.name == api_logger.name]
+        assert record.levelno == logging.WARNING
+        assert "Failed to pre-warm CV prompt templates" in record.getMessage()
+        assert isinstance(record.exc_info[1], FileNotFoundError)
@@ -0,0 +1,36 @@
+"""Tests for the cleanup_empty_description_jobs script's candidate sweep."""
+
+import pytest
+import pytest_asyncio
+
+from scripts.cleanup_empty_description_jobs import _find_candidates
+from src.models.unified import JobRecord
+from src.services.db.job_repository import SQLiteJobRepository
+
+
+@pytest_asyncio.fixture
+async def repo(tmp_path):
+    repo = SQLiteJobRepository(db_path=str(tmp_path / "cleanup.db"))
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+def _job(job_id: str, description: str, status: str = "pending", user_id: str = "u1") -> JobRecord:
+    return JobRecord(
+        job_id=job_id, user_id=user_id, source="linkedin", mode="mvp", status=status,
+        job_posting={"title": "Engineer", "company": "Acme", "description": description},
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_candidates_reads_the_repository_database(repo):
+    """The sweep must hit the repo's own database, across users."""
+    await repo.create(_job("short-1", "too short"))
+    await repo.create(_job("short-2", "", status="applied", user_id="u2"))
+    await repo.create(_job("long", "x" * 500))
+    await repo.create(_job("skipped", "", status="filtered_out"))
+
+    candidates = await _find_candidates(repo, min_chars=200)
+
+    assert sorted(c.job_id for c in candidates) == ["short-1", "short-2"]
@@ -195,3 +195,23 @@ class TestSQLiteCVAttempts:
         retrieved = await sqlite_repo.get_latest_cv_attempt("job-1")
         assert retrieved is not None
         assert retrieved.cv_json == cv_data
+
+    async def test_cleanup_removes_attempts(self, sqlite_repo):
+        from datetime import timedelta
+
+        old_job = JobRecord(
+            job_id="old-1",
+            source="manual",
+            mode="full",
+            status="declined",
+            created_at=datetime.now(tz=timezone.utc) - timedelta(days=100),
+        )
+        await sqlite_repo.create(old_job)
+        await sqlite_repo.create(_make_job("keep-1"))
+        await sqlite_repo.create_cv_attempt(_make_attempt("old-1", 1))
+        await sqlite_repo.create_cv_attempt(_make_attempt("keep-1", 1))
+
+        deleted = await sqlite_repo.cleanup(older_than_days=90, statuses=["declined"])
+        assert deleted == 1
+        assert await sqlite_repo.get_cv_attempts("old-1") == []
+        assert len(await sqlite_repo.get_cv_attempts("keep-1")) == 1
@@ -15,6 +15,7 @@ from src.services.cv.cv_validator import (
     CVValidator,
     HallucinationPolicy,
 )
+from src.services.cv.job_summary_cache import JobSummaryCache
 
 # Test fixtures directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -161,6 +162,60 @@ class TestJobSummarization:
         assert result["soft_skills"] == []
 
 
+class TestJobSummaryCache:
+    """Test reuse of job summaries across CVComposer instances"""
+
+    SUMMARY = {
+        "technical_skills": ["Python"],
+        "soft_skills": [],
+        "education_reqs": [],
+        "experience_reqs": {"years": 3, "level": "mid"},
+        "responsibilities": ["Build APIs"],
+        "nice_to_have": [],
+    }
+
+    def test_second_summary_served_from_cache(self, mock_llm_client, job_posting):
+        """A repeated posting does not trigger a second LLM call"""
+        mock_llm_client.set_response("job description", self.SUMMARY)
+        cache = JobSummaryCache()
+
+        first = CVComposer(llm_client=mock_llm_client, summary_cache=cache)._summarize_job(
+            job_posting
+        )
+        second = CVComposer(llm_client=mock_llm_client, summary_cache=cache)._summarize_job(
+            job_posting
+        )
+
+        assert mock_llm_client.call_count == 1
+        assert first == second
+        assert cache.hits == 1
+
+    def test_whitespace_and_case_differences_share_key(self):
+        """Cosmetic formatting differences map to the same cache key"""
+        a = JobSummaryCache.make_key("m", "Senior  Python\nEngineer")
+        b = JobSummaryCache.make_key("m", "senior python engineer ")
+        assert a == b
+        assert a != JobSummaryCache.make_key("other-model", "senior python engineer")
+
+    def test_cached_value_is_isolated_from_caller_mutation(self):
+        """Mutating a returned summary does not corrupt the cache"""
+        cache = JobSummaryCache()
+        cache.put("k", {"technical_skills": ["Python"]})
+        cache.get("k")["technical_skills"].append("Go")
+        assert cache.get("k") == {"technical_skills": ["Python"]}
+
+    def test_lru_eviction(self):
+        """Oldest entries are evicted beyond max_entries"""
+        cache = JobSummaryCache(max_entries=2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")
+        cache.put("c", {})
+        assert cache.get("b") is None
+        assert cache.get("a") == {}
+        assert len(cache) == 2
+
+
 class TestComposeCVIntegration:
     """Test compose_cv() end-to-end flow"""
 
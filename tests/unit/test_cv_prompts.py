@@ -1,12 +1,21 @@
 """Tests for CV prompt management"""
 
+import json
+import os
 import shutil
 import tempfile
 from pathlib import Path
+from string import Template
+from unittest.mock import patch
 
 import pytest
 
-from src.services.cv.cv_prompts import CVPromptManager, PromptLoader
+from src.services.cv.cv_prompts import (
+    CVPromptManager,
+    PromptLoader,
+    _dumps_indented,
+    _fast_substitute,
+)
 
 
 class TestPromptLoader:
@@ -143,6 +152,45 @@ class TestPromptLoader:
 
         assert "$variable" in result  # Variable not substituted
 
+    def test_substitution_matches_string_template(self):
+        """The regex substitution keeps safe_substitute semantics."""
+        text = "$a ${b}c $$a $missing ${missing} $ 5$"
+        mapping = {"a": 1, "b": "B"}
+
+        assert _fast_substitute(text, mapping) == Template(text).safe_substitute(mapping)
+
+    def test_get_template_reuses_parsed_segments(self, temp_prompts_dir):
+        """A template is parsed once and the parse is dropped on reload."""
+        loader = PromptLoader(temp_prompts_dir)
+
+        assert loader.get_template("test_prompt", variable="a").endswith("a")
+        segments = loader._segments["test_prompt"]
+        assert loader.get_template("test_prompt", variable="b").endswith("b")
+        assert loader._segments["test_prompt"] is segments
+
+        loader.reload("test_prompt")
+        assert "test_prompt" not in loader._segments
+
+    def test_auto_reload_picks_up_edited_file(self, temp_prompts_dir):
+        """With auto_reload, a changed mtime re-reads only that prompt."""
+        loader = PromptLoader(temp_prompts_dir, auto_reload=True)
+        assert loader.load("test_prompt") == "This is a test prompt with $variable"
+
+        path = temp_prompts_dir / "test_prompt.txt"
+        path.write_text("Edited $variable")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert loader.load("test_prompt") == "Edited $variable"
+
+    def test_without_auto_reload_cache_ignores_edits(self, temp_prompts_dir):
+        """By default cache hits never go back to disk."""
+        loader = PromptLoader(temp_prompts_dir)
+        loader.load("test_prompt")
+        (temp_prompts_dir / "test_prompt.txt").write_text("Edited")
+
+        assert loader.load("test_prompt") == "This is a test prompt with $variable"
+
 
 class TestCVPromptManager:
     """Test CVPromptManager class"""
@@ -204,6 +252,54 @@ class TestCVPromptManager:
         assert "Python developer needed" in spec.user
         assert spec.cache_key == "cv_summary:user-1"
 
+    def test_warm_serves_templates_without_disk(self, temp_prompts_dir):
+        """After warm(), specs and section prompts are served from the cache."""
+        for name in ("job_summary", "full_cv"):
+            (temp_prompts_dir / f"{name}.system.txt").write_text(f"{name} system")
+            (temp_prompts_dir / f"{name}.user.txt").write_text("$job_description")
+
+        manager = CVPromptManager(temp_prompts_dir)
+        manager.warm()
+        for path in temp_prompts_dir.glob("*.txt"):
+            path.unlink()
+
+        spec = manager.get_job_summary_spec(job_description="JD", cache_key="")
+        assert spec.system == "job_summary system"
+        assert spec.user == "JD"
+        assert "Experiences:" in manager.get_experience_prompt([], {})
+
+    def test_warm_reads_each_template_once(self, temp_prompts_dir):
+        """warm() caches split and single-file templates in a single pass."""
+        for name in ("job_summary", "full_cv"):
+            (temp_prompts_dir / f"{name}.system.txt").write_text("s")
+            (temp_prompts_dir / f"{name}.user.txt").write_text("u")
+
+        manager = CVPromptManager(temp_prompts_dir)
+        assert manager.loader._cache == {}
+
+        with patch.object(
+            manager.loader, "_read_and_cache", wraps=manager.loader._read_and_cache
+        ) as read:
+            manager.warm()
+
+        keys = [c.args[0] for c in read.call_args_list]
+        assert len(keys) == len(set(keys))
+        assert {"full_cv.system", "full_cv.user", "summary", "skills"} <= set(keys)
+
+    def test_warm_requires_spec_templates(self, temp_prompts_dir):
+        """warm() fails loudly when a spec template the pipeline needs is missing."""
+        with pytest.raises(FileNotFoundError):
+            CVPromptManager(temp_prompts_dir).warm()
+
+    def test_warm_skips_missing_section_prompts(self, temp_prompts_dir):
+        """Section templates are optional during warm-up."""
+        shutil.rmtree(temp_prompts_dir / "examples")
+        for name in ("job_summary", "full_cv"):
+            (temp_prompts_dir / f"{name}.system.txt").write_text("s")
+            (temp_prompts_dir / f"{name}.user.txt").write_text("u")
+
+        CVPromptManager(temp_prompts_dir).warm()
+
     def test_get_summary_prompt(self, temp_prompts_dir):
         """Test getting summary prompt"""
         manager = CVPromptManager(temp_prompts_dir)
@@ -279,3 +375,56 @@ class TestCVPromptManager:
 
         assert "Certs:" in prompt
         assert "AWS Certified" in prompt
+
+    def test_full_cv_spec_uses_preserialized_job_summary(self, temp_prompts_dir):
+        """A caller-serialized job summary is embedded as-is, not re-dumped."""
+        (temp_prompts_dir / "full_cv.system.txt").write_text("CV:\n$master_cv")
+        (temp_prompts_dir / "full_cv.user.txt").write_text("Job:\n$job_summary")
+        manager = CVPromptManager(temp_prompts_dir)
+        job_summary = {"technical_skills": ["Python"]}
+        serialized = manager.serialize_job_summary(job_summary)
+
+        spec = manager.get_full_cv_spec(
+            master_cv={}, job_summary=job_summary, cache_key="", job_summary_json=serialized
+        )
+        fallback = manager.get_full_cv_spec(master_cv={}, job_summary=job_summary, cache_key="")
+
+        assert spec.user == f"Job:\n{serialized}"
+        assert fallback.user == spec.user
+        assert not hasattr(manager, "_job_summary_cache")
+
+    def test_section_prompts_are_deprecated(self, temp_prompts_dir):
+        """Per-section getters warn callers toward the single full_cv call."""
+        manager = CVPromptManager(temp_prompts_dir)
+
+        with pytest.deprecated_call():
+            manager.get_skills_prompt([], {})
+
+    def test_full_cv_spec_reflects_mutated_master_cv(self, temp_prompts_dir):
+        """The master CV is serialized per call, so in-place edits show up."""
+        (temp_prompts_dir / "full_cv.system.txt").write_text("CV:\n$master_cv")
+        (temp_prompts_dir / "full_cv.user.txt").write_text("$job_summary")
+        manager = CVPromptManager(temp_prompts_dir)
+        master_cv = {"summary": "Engineer"}
+
+        first = manager.get_full_cv_spec(master_cv=master_cv, job_summary={}, cache_key="")
+        master_cv["summary"] = "Manager"
+        second = manager.get_full_cv_spec(master_cv=master_cv, job_summary={}, cache_key="")
+
+        assert "Engineer" in first.system
+        assert "Manager" in second.system
+
+
+class TestDumpsIndented:
+    def test_matches_json_indent_layout(self):
+        data = {"name": "Ada", "skills": ["Python", "SQL"], "years": 5, "remote": None}
+        assert _dumps_indented(data) == json.dumps(data, indent=2)
+
+    def test_non_ascii_written_as_utf8(self):
+        data = {"contact": {"full_name": "Zoë Ångström"}, "city": "München"}
+
+        dumped = _dumps_indented(data)
+
+        assert "Zoë Ångström" in dumped
+        assert "\\u" not in dumped
+        assert dumped == json.dumps(data, indent=2, ensure_ascii=False)
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.context import AppContext
-from src.models.unified import HITLDecision, JobRecord
+from src.models.unified import HITLDecision, JobRecord, JobRecordSummary
 from src.services.jobs.hitl_processor import HITLProcessor
 
 pytestmark = pytest.mark.asyncio
@@ -186,17 +186,17 @@ class TestGetHistory:
 
     async def test_returns_history(self):
         jobs = [
-            JobRecord(
+            JobRecordSummary.from_record(JobRecord(
                 job_id="job-1",
                 user_id=TEST_USER_ID,
                 source="manual",
                 mode="full",
                 status="approved",
                 job_posting={"title": "Engineer", "company": "Acme"},
-            ),
+            )),
         ]
         repo = AsyncMock()
-        repo.get_history = AsyncMock(return_value=jobs)
+        repo.get_history_summaries = AsyncMock(return_value=jobs)
         ctx = _make_ctx(repository=repo)
         processor = HITLProcessor(ctx)
 
@@ -209,19 +209,19 @@ class TestGetHistory:
 
     async def test_with_status_filter(self):
         repo = AsyncMock()
-        repo.get_history = AsyncMock(return_value=[])
+        repo.get_history_summaries = AsyncMock(return_value=[])
         ctx = _make_ctx(repository=repo)
         processor = HITLProcessor(ctx)
 
         await processor.get_history(TEST_USER_ID, limit=50, status="declined")
 
-        repo.get_history.assert_awaited_once_with(
+        repo.get_history_summaries.assert_awaited_once_with(
             user_id=TEST_USER_ID, limit=50, statuses=["declined"]
         )
 
     async def test_propagates_repository_error(self):
         repo = AsyncMock()
-        repo.get_history = AsyncMock(side_effect=NotImplementedError)
+        repo.get_history_summaries = AsyncMock(side_effect=NotImplementedError)
         ctx = _make_ctx(repository=repo)
         processor = HITLProcessor(ctx)
 
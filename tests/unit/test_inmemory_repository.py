@@ -5,11 +5,14 @@ do not cause lost updates or race conditions.
 """
 
 import asyncio
+import warnings
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from src.models.unified import JobRecord
 from src.services.db.job_repository import InMemoryJobRepository, RepositoryError
+from src.services.db.repository import decode_cursor, encode_cursor, next_cursor
 
 pytestmark = pytest.mark.asyncio
 
@@ -165,3 +168,323 @@ class TestInMemoryUserFiltering:
         history = await repo.get_history(TEST_USER_ID)
         assert len(history) == 1
         assert history[0].user_id == TEST_USER_ID
+
+    async def test_get_history_summaries(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(JobRecord(
+            job_id="j1", user_id=TEST_USER_ID, source="url", mode="full", status="applied",
+            job_posting={"title": "Engineer", "company": "Acme"},
+        ))
+        await repo.create(JobRecord(
+            job_id="j2", user_id=TEST_USER_ID, source="url", mode="full", status="declined",
+        ))
+
+        summaries = await repo.get_history_summaries(TEST_USER_ID, statuses=["applied"])
+        assert [(s.job_id, s.job_title, s.company) for s in summaries] == [
+            ("j1", "Engineer", "Acme")
+        ]
+        all_summaries = await repo.get_history_summaries(TEST_USER_ID)
+        assert {s.job_id for s in all_summaries} == {"j1", "j2"}
+
+
+class TestInMemoryKeysetPagination:
+    """Cursor paging matches the SQLite keyset ordering."""
+
+    async def _seed(self, repo: InMemoryJobRepository, n: int) -> None:
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(n):
+            # Pairs share a timestamp so the job_id tie-break is exercised.
+            stamp = ts + timedelta(minutes=i // 2)
+            await repo.create(JobRecord(
+                job_id=f"job-{i}", user_id=TEST_USER_ID, source="url", mode="full",
+                status="pending", created_at=stamp, updated_at=stamp,
+            ))
+
+    async def test_get_all_pages_cover_every_job_once(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await self._seed(repo, 7)
+
+        seen: list[str] = []
+        after = None
+        while page := await repo.get_all(TEST_USER_ID, limit=3, after=after):
+            seen.extend(j.job_id for j in page)
+            after = decode_cursor(next_cursor(page))
+
+        assert seen == [f"job-{i}" for i in (6, 5, 4, 3, 2, 1, 0)]
+
+    async def test_get_by_status_ascending_cursor(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await self._seed(repo, 5)
+
+        first = await repo.get_by_status(TEST_USER_ID, "pending", limit=2, order_desc=False)
+        rest = await repo.get_by_status(
+            TEST_USER_ID, "pending", order_desc=False, after=decode_cursor(next_cursor(first))
+        )
+
+        assert [j.job_id for j in first + rest] == [f"job-{i}" for i in range(5)]
+
+    async def test_get_history_cursor_uses_updated_at(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await self._seed(repo, 4)
+
+        first = await repo.get_history(TEST_USER_ID, limit=2)
+        rest = await repo.get_history(
+            TEST_USER_ID, after=decode_cursor(next_cursor(first, order_by="updated_at"))
+        )
+
+        assert [j.job_id for j in first + rest] == ["job-3", "job-2", "job-1", "job-0"]
+
+    async def test_offset_still_pages(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await self._seed(repo, 3)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            page = await repo.get_all(TEST_USER_ID, limit=2, offset=2)
+        assert [j.job_id for j in page] == ["job-0"]
+
+    async def test_cursor_round_trip(self):
+        ts = datetime(2026, 3, 4, 5, 6, 7, 891011, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(ts, "job|1")) == (ts, "job|1")
+
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestInMemoryUrlIndex:
+    """find_by_application_url is served from the url -> job_id index."""
+
+    def _job(self, job_id: str, url: str | None, user_id: str = TEST_USER_ID) -> JobRecord:
+        return JobRecord(
+            job_id=job_id, user_id=user_id, source="url", mode="full",
+            status="queued", application_url=url,
+        )
+
+    async def test_index_tracks_create_update_delete(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(self._job("j1", "https://a"))
+        assert (await repo.find_by_application_url("https://a")).job_id == "j1"
+
+        await repo.update("j1", {"application_url": "https://b"})
+        assert await repo.find_by_application_url("https://a") is None
+        assert (await repo.find_by_application_url("https://b")).job_id == "j1"
+
+        await repo.delete("j1")
+        assert await repo.find_by_application_url("https://b") is None
+        assert repo._url_index == {}
+
+    async def test_shared_url_scoped_by_user(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(self._job("mine", "https://shared"))
+        await repo.create(self._job("theirs", "https://shared", user_id="other-user"))
+
+        assert (await repo.find_by_application_url("https://shared")).job_id == "mine"
+        found = await repo.find_by_application_url("https://shared", user_id="other-user")
+        assert found.job_id == "theirs"
+
+        await repo.delete_for_user("mine", TEST_USER_ID)
+        assert (await repo.find_by_application_url("https://shared")).job_id == "theirs"
+
+
+class TestInMemoryStatusBuckets:
+    """Status-filtered queries read from the status -> job_id buckets."""
+
+    async def test_buckets_follow_status_changes(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("j1", status="pending"))
+        await repo.create(_make_job("j2", status="pending"))
+
+        await repo.update("j1", {"status": "approved"})
+        assert [j.job_id for j in await repo.get_pending(TEST_USER_ID)] == ["j2"]
+        assert [j.job_id for j in await repo.get_by_status(TEST_USER_ID, "approved")] == ["j1"]
+
+        await repo.delete("j2")
+        assert await repo.get_pending(TEST_USER_ID) == []
+        assert repo._by_status["pending"] == set()
+
+    async def test_retry_claim_moves_bucket(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("j1", status="failed"))
+
+        assert await repo.try_claim_failed_for_retry("j1") is not None
+        assert await repo.list_by_states(["failed"]) == []
+        assert [j.job_id for j in await repo.list_by_states(["queued"])] == ["j1"]
+
+    async def test_single_status_history_uses_status_path(self, monkeypatch):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("j1", status="pending"))
+        await repo.create(_make_job("j2", status="queued"))
+
+        calls: list[str] = []
+        original = repo.get_by_status
+
+        async def spy(user_id, status, **kwargs):
+            calls.append(status)
+            return await original(user_id, status, **kwargs)
+
+        monkeypatch.setattr(repo, "get_by_status", spy)
+
+        history = await repo.get_history(TEST_USER_ID, statuses=["pending"])
+        assert [j.job_id for j in history] == ["j1"]
+        assert calls == ["pending"]
+
+    async def test_empty_store_and_buckets_return_empty(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        assert await repo.get_all(TEST_USER_ID) == []
+        assert await repo.get_history(TEST_USER_ID) == []
+
+        await repo.create(_make_job("j1", status="pending"))
+        assert await repo.get_by_status(TEST_USER_ID, "applied") == []
+        assert await repo.get_history(TEST_USER_ID, statuses=["applied", "declined"]) == []
+        history = await repo.get_history(TEST_USER_ID, statuses=["applied", "pending"])
+        assert [j.job_id for j in history] == ["j1"]
+
+    async def test_cleanup_only_touches_requested_statuses(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        old = datetime.now(tz=timezone.utc) - timedelta(days=30)
+        for job_id, status in (("d1", "declined"), ("a1", "applied")):
+            await repo.create(JobRecord(
+                job_id=job_id, user_id=TEST_USER_ID, source="url", mode="full",
+                status=status, created_at=old,
+            ))
+
+        assert await repo.cleanup(older_than_days=7, statuses=["declined"]) == 1
+        assert await repo.get("d1") is None
+        assert await repo.get("a1") is not None
+        history = await repo.get_history(TEST_USER_ID, statuses=["applied"])
+        assert [j.job_id for j in history] == ["a1"]
+
+
+class TestInMemorySortedKeys:
+    """List queries walk pre-sorted (timestamp, job_id) keys."""
+
+    async def test_history_reorders_after_update(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        for i in range(3):
+            await repo.create(_make_job(f"j{i}", status="pending"))
+            await asyncio.sleep(0.001)
+
+        await repo.update("j0", {"error_message": "touched"})
+
+        history = await repo.get_history(TEST_USER_ID)
+        assert [j.job_id for j in history] == ["j0", "j2", "j1"]
+        assert len(repo._by_created) == len(repo._by_updated) == 3
+
+    async def test_update_does_not_touch_returned_records(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("j1", status="pending"))
+        before = await repo.get("j1")
+
+        await repo.update("j1", {"status": "approved", "application_url": "https://a"})
+
+        after = await repo.get("j1")
+        assert after is not before
+        assert before.status == "pending"
+        assert after.status == "approved"
+        assert (await repo.find_by_application_url("https://a")).job_id == "j1"
+        assert await repo.get_pending(TEST_USER_ID) == []
+
+    async def test_mutating_returned_record_keeps_indexes_in_sync(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        job = _make_job("j1", status="pending")
+        await repo.create(job)
+        await repo.create(_make_job("j2", status="pending"))
+
+        job.updated_at = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        fetched = await repo.get("j1")
+        fetched.updated_at = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        fetched.status = "approved"
+
+        await repo.update("j1", {"error_message": "touched"})
+        assert await repo.delete("j1")
+        assert len(repo._by_created) == len(repo._by_updated) == 1
+        assert [j.job_id for j in await repo.get_pending(TEST_USER_ID)] == ["j2"]
+
+    async def test_naive_timestamps_are_stored_as_utc(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("aware", status="pending"))
+        naive = datetime(2024, 1, 1, 12, 0)
+        await repo.create(
+            _make_job("naive", status="pending").model_copy(
+                update={"created_at": naive, "updated_at": naive}
+            )
+        )
+
+        stored = await repo.get("naive")
+        assert stored.created_at == naive.replace(tzinfo=timezone.utc)
+        assert [j.job_id for j in await repo.get_all(TEST_USER_ID)] == ["aware", "naive"]
+
+    async def test_update_many_applies_in_order_with_one_timestamp(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("j1", status="pending"))
+        await repo.create(_make_job("j2", status="pending"))
+
+        await repo.update_many([
+            ("j1", {"status": "approved"}),
+            ("j2", {"error_message": "touched"}),
+            ("j1", {"status": "applying"}),
+        ])
+
+        j1, j2 = await repo.get("j1"), await repo.get("j2")
+        assert j1.status == "applying"
+        assert j2.error_message == "touched"
+        assert j1.updated_at == j2.updated_at
+        assert [j.job_id for j in await repo.get_pending(TEST_USER_ID)] == ["j2"]
+
+    async def test_update_many_is_all_or_nothing(self):
+        from src.models.state_machine import InvalidStateTransitionError
+
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("j1", status="pending"))
+
+        with pytest.raises(RepositoryError):
+            await repo.update_many([("j1", {"status": "approved"}), ("missing", {})])
+        with pytest.raises(InvalidStateTransitionError):
+            await repo.update_many([("j1", {"status": "declined"}), ("j1", {"status": "pending"})])
+        assert (await repo.get("j1")).status == "pending"
+
+    async def test_mark_refine_signals_reorders_history(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        await repo.create(_make_job("j1", status="declined"))
+        await repo.create(_make_job("j2", status="declined"))
+
+        await repo.mark_refine_signals(["j1"], "consumed")
+
+        assert (await repo.get("j1")).refine_signal_state == "consumed"
+        assert [j.job_id for j in await repo.get_history(TEST_USER_ID)] == ["j1", "j2"]
+
+    async def test_walk_stops_at_limit(self):
+        repo = InMemoryJobRepository()
+        await repo.initialize()
+        for i in range(5):
+            await repo.create(_make_job(f"j{i}", status="pending"))
+            await asyncio.sleep(0.001)
+
+        seen: list[str] = []
+
+        def match(job: JobRecord) -> bool:
+            seen.append(job.job_id)
+            return True
+
+        page = repo._walk(repo._by_created, match, 2)
+        assert [j.job_id for j in page] == ["j4", "j3"]
+        assert seen == ["j4", "j3"]
@@ -17,6 +17,7 @@ from pydantic import BaseModel
 
 from src.llm.base import LLMProvider
 from src.llm.prompt_spec import PromptSpec
+from src.llm.providers import instructor_client
 from src.llm.providers.instructor_client import (
     InstructorClient,
     litellm_model,
@@ -163,6 +164,30 @@ class TestPromptCaching:
         assert "prompt_cache_key" not in body
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP connection pool
+# ---------------------------------------------------------------------------
+
+
+class TestConnectionPool:
+    def test_openai_calls_reuse_shared_http_client(self):
+        senders: list = []
+
+        def fake_send(self, request, *args, **kwargs):  # noqa: ANN001
+            senders.append(self)
+            raise _AbortError()
+
+        spec = PromptSpec(system="SYS", user="hi", cache_key="")
+        with patch.object(httpx.Client, "send", fake_send):
+            for _ in range(2):
+                client = InstructorClient(api_key="test", model="openai/gpt-4o")
+                with contextlib.suppress(Exception):
+                    client.generate(spec)
+
+        assert senders
+        assert all(sender is instructor_client._HTTP_CLIENT for sender in senders)
+
+
 # ---------------------------------------------------------------------------
 # generate_json (structured output)
 # ---------------------------------------------------------------------------
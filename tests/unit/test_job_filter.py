@@ -8,6 +8,7 @@ import pytest
 from src.llm.prompt_spec import PromptSpec
 from src.llm.provider import BaseLLMClient
 from src.models.job_filter import FilterResult, UserFilterPreferences
+from src.services.jobs.filter_decision_cache import FilterDecisionCache
 from src.services.jobs.job_filter import JobFilter, JobFilterError
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -255,6 +256,66 @@ class TestEvaluateJob:
             job_filter.evaluate_job(job_posting)
 
 
+# ---------------------------------------------------------------------------
+# Decision cache tests
+# ---------------------------------------------------------------------------
+
+
+class TestDecisionCache:
+    @pytest.fixture
+    def cache(self):
+        return FilterDecisionCache()
+
+    @pytest.fixture
+    def cached_filter(self, mock_llm, cache):
+        return JobFilter(
+            llm_client=mock_llm, prompts_dir="prompts/job_filter", decision_cache=cache
+        )
+
+    def test_repeated_posting_skips_llm(
+        self, cached_filter, mock_llm, cache, job_posting, good_filter_result_dict
+    ):
+        mock_llm.set_generate_json_response(good_filter_result_dict)
+        repost = {**job_posting, "description": "  " + job_posting["description"].upper()}
+
+        first = cached_filter.evaluate_job(job_posting)
+        second = cached_filter.evaluate_job(repost)
+
+        assert len(mock_llm.generate_json_calls) == 1
+        assert second == first
+        assert cache.hits == 1
+
+    def test_different_criteria_miss(
+        self, cached_filter, mock_llm, job_posting, good_filter_result_dict
+    ):
+        mock_llm.set_generate_json_response(good_filter_result_dict)
+
+        cached_filter.evaluate_job(job_posting)
+        cached_filter.evaluate_job(
+            job_posting, user_filter_prefs=UserFilterPreferences(custom_prompt="No agencies.")
+        )
+
+        assert len(mock_llm.generate_json_calls) == 2
+
+    def test_returned_result_is_a_copy(
+        self, cached_filter, mock_llm, job_posting, warning_filter_result_dict
+    ):
+        mock_llm.set_generate_json_response(warning_filter_result_dict)
+
+        cached_filter.evaluate_job(job_posting).red_flags.clear()
+
+        assert len(cached_filter.evaluate_job(job_posting).red_flags) == 2
+
+    def test_lru_bound(self, good_filter_result_dict):
+        cache = FilterDecisionCache(max_entries=2)
+        result = FilterResult(**good_filter_result_dict)
+        for key in (b"a", b"b", b"c"):
+            cache.put(key, result)
+
+        assert len(cache) == 2
+        assert cache.get(b"a") is None
+
+
 # ---------------------------------------------------------------------------
 # should_reject / should_warn tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,51 @@
+"""Tests for job source adapters and the adapter factory."""
+
+import pytest
+
+from src.services.jobs.job_source import JobSourceFactory, ManualJobAdapter, URLJobExtractor
+
+
+@pytest.mark.parametrize(
+    ("url", "supported"),
+    [
+        ("https://jobs.lever.co/acme/123", True),
+        ("https://lever.co/careers", True),
+        ("https://boards.greenhouse.io/acme/jobs/1", True),
+        ("https://acme.wd5.myworkdayjobs.com/en-US/External/job/1", True),
+        ("https://JOBS.LEVER.CO./acme", True),
+        ("https://notlever.co/acme", False),
+        ("https://lever.co.evil.com/acme", False),
+        ("https://example.com/job/123", False),
+        ("not a url", False),
+        ("", False),
+    ],
+)
+def test_is_supported_domain(url, supported):
+    assert URLJobExtractor()._is_supported_domain(url) is supported
+
+
+def test_factory_builds_adapters_on_first_use():
+    factory = JobSourceFactory(llm_client="llm")
+    assert factory._adapters == {}
+
+    adapter = factory.get_adapter("url")
+    assert isinstance(adapter, URLJobExtractor)
+    assert adapter.llm_client == "llm"
+    assert factory.get_adapter("url") is adapter
+    assert list(factory._adapters) == ["url"]
+
+
+def test_factory_autodetect_keeps_order_and_laziness():
+    factory = JobSourceFactory()
+    manual = {"title": "Engineer", "company": "Acme", "description": "Build things"}
+
+    assert isinstance(factory.get_adapter_for_input(manual), ManualJobAdapter)
+    assert "linkedin" not in factory._adapters
+    assert isinstance(factory.get_adapter_for_input({"url": "https://x"}), URLJobExtractor)
+    with pytest.raises(ValueError):
+        factory.get_adapter_for_input({"unknown": 1})
+
+
+def test_factory_unknown_source_type():
+    with pytest.raises(ValueError, match="Unknown source type"):
+        JobSourceFactory().get_adapter("rss")
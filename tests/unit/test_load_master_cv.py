@@ -0,0 +1,66 @@
+"""Tests for ``load_master_cv`` (agents/_shared): mtime-keyed read cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# WeasyPrint loads native system libraries at import time; ``_shared`` chains
+# into it, so stub the package before importing (see test_create_llm_client).
+_wp_mock = MagicMock()
+for _mod in [
+    "weasyprint",
+    "weasyprint.css",
+    "weasyprint.html",
+    "weasyprint.text",
+    "weasyprint.text.fonts",
+]:
+    sys.modules.setdefault(_mod, _wp_mock)
+
+from src.agents import _shared  # noqa: E402,I001
+
+
+@pytest.fixture
+def cv_file(tmp_path):
+    path = tmp_path / "master_cv.json"
+    path.write_text(json.dumps({"summary": "v1"}), encoding="utf-8")
+    _shared._read_master_cv.cache_clear()
+    with patch.object(_shared.settings, "master_cv_path", str(path)):
+        yield path
+    _shared._read_master_cv.cache_clear()
+
+
+class TestLoadMasterCV:
+    def test_loads_json(self, cv_file):
+        assert _shared.load_master_cv() == {"summary": "v1"}
+
+    def test_unchanged_file_is_read_once(self, cv_file):
+        first = _shared.load_master_cv()
+        second = _shared.load_master_cv()
+        assert first == second
+        assert _shared._read_master_cv.cache_info().misses == 1
+
+    def test_callers_get_independent_copies(self, cv_file):
+        cv_file.write_text(json.dumps({"skills": [{"name": "Python"}]}), encoding="utf-8")
+        first = _shared.load_master_cv()
+        first["skills"][0]["name"] = "Mutated"
+        first["summary"] = "added"
+
+        assert _shared.load_master_cv() == {"skills": [{"name": "Python"}]}
+
+    def test_modified_file_is_reloaded(self, cv_file):
+        _shared.load_master_cv()
+        cv_file.write_text(json.dumps({"summary": "v2"}), encoding="utf-8")
+        stat = cv_file.stat()
+        os.utime(cv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert _shared.load_master_cv() == {"summary": "v2"}
+
+    def test_missing_file_raises(self, tmp_path):
+        with patch.object(_shared.settings, "master_cv_path", str(tmp_path / "nope.json")):
+            with pytest.raises(FileNotFoundError, match="Master CV not found"):
+                _shared.load_master_cv()
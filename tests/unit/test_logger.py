@@ -0,0 +1,46 @@
+"""Tests for logging setup."""
+
+import atexit
+import logging
+import logging.handlers
+import uuid
+
+from src.utils.logger import _CachedTimeFormatter, setup_logger
+
+
+def test_setup_logger_writes_through_queue_listener(tmp_path):
+    log_file = tmp_path / "logs" / "app.log"
+    name = f"test-{uuid.uuid4()}"
+
+    logger = setup_logger(name, level="INFO", log_file=str(log_file))
+    assert [type(h) for h in logger.handlers] == [logging.handlers.QueueHandler]
+    assert setup_logger(name) is logger
+    assert len(logger.handlers) == 1
+
+    logger.debug("filtered out")
+    logger.info("hello %s", "world")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.error("failed", exc_info=True)
+
+    # stop() drains the queue and joins the listener thread
+    listener = logger.handlers[0].listener
+    atexit.unregister(listener.stop)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+    contents = log_file.read_text(encoding="utf-8")
+    assert f"INFO [{name}." in contents and "hello world" in contents
+    assert "ValueError: boom" in contents
+    assert "filtered out" not in contents
+
+
+def test_cached_time_formatter_matches_stdlib():
+    fmt, datefmt = "[%(asctime)s] %(message)s", "%Y-%m-%d %H:%M:%S"
+    cached, plain = _CachedTimeFormatter(fmt, datefmt), logging.Formatter(fmt, datefmt)
+
+    for created in (1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.0, 1_700_000_000.5):
+        record = logging.makeLogRecord({"msg": "m", "created": created})
+        assert cached.format(record) == plain.format(record)
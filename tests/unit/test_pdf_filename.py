@@ -0,0 +1,50 @@
+"""Tests for the generated-PDF filename built in ``agents/_shared``."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# WeasyPrint loads native system libraries at import time; ``_shared`` chains
+# into it, so stub the package before importing (see test_load_master_cv).
+_wp_mock = MagicMock()
+for _mod in [
+    "weasyprint",
+    "weasyprint.css",
+    "weasyprint.html",
+    "weasyprint.text",
+    "weasyprint.text.fonts",
+]:
+    sys.modules.setdefault(_mod, _wp_mock)
+
+from src.agents._shared import _pdf_filename  # noqa: E402,I001
+
+
+def _isalnum_filename(name: str, company: str, title: str, suffix: str) -> str:
+    """The original character-by-character sanitisation."""
+
+    def safe(value: str) -> str:
+        return "".join(c for c in value if c.isalnum() or c in (" ", "-", "_")).strip()
+
+    return f"{safe(name)}_{safe(company)}_{safe(title)}{suffix}.pdf".replace(" ", "_")
+
+
+@pytest.mark.parametrize(
+    ("name", "company", "title", "suffix"),
+    [
+        ("Jane Smith", "Acme, Inc.", "Senior Engineer (Python)", ""),
+        ("Zoë  Ångström", "Müller & Söhne", "Dev\tOps / SRE", "_v2"),
+        ("  O'Brien ", "A--B_C", "C++   Developer", ""),
+        ("李 小龙", "株式会社", "エンジニア", "_v3"),
+    ],
+)
+def test_matches_original_sanitisation(name, company, title, suffix):
+    assert _pdf_filename(name, company, title, suffix) == _isalnum_filename(
+        name, company, title, suffix
+    )
+
+
+def test_space_runs_are_not_collapsed():
+    assert _pdf_filename("Jane  Smith", "Acme", "Dev", "") == "Jane__Smith_Acme_Dev.pdf"
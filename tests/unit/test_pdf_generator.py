@@ -1,10 +1,13 @@
 """Unit tests for PDF Generator service"""
 
+import os
+import shutil
+import sys
 from pathlib import Path
 
 import pytest
 
-from src.services.cv.pdf_generator import PDFGenerator
+from src.services.cv.pdf_generator import PDFGenerator, _format_date_str, get_pdf_generator
 
 
 # WeasyPrint requires system libraries (Pango, GLib).  On macOS they are found
@@ -44,6 +47,22 @@ class TestPDFGenerator:
         assert PDFGenerator._format_date("2020-12-31") == "Dec 2020"
         assert PDFGenerator._format_date("2024-01-15") == "Jan 2024"
 
+    def test_format_date_object_and_unparseable(self):
+        """Date objects format directly; unparseable strings pass through"""
+        from datetime import date, datetime
+
+        assert PDFGenerator._format_date(date(2021, 6, 30)) == "Jun 2021"
+        assert PDFGenerator._format_date(datetime(2021, 6, 30, 12)) == "Jun 2021"
+        assert PDFGenerator._format_date(2021) == "2021"
+        assert PDFGenerator._format_date("Summer 2019") == "Summer 2019"
+
+    def test_format_date_string_memoized(self):
+        """Repeat date strings are answered from the parse cache"""
+        _format_date_str.cache_clear()
+        assert PDFGenerator._format_date("2019-07-01") == "Jul 2019"
+        assert PDFGenerator._format_date("2019-07-01") == "Jul 2019"
+        assert _format_date_str.cache_info().hits == 1
+
     def test_format_date_none(self):
         """Test date filter handles None as 'Present'"""
         assert PDFGenerator._format_date(None) == "Present"
@@ -53,6 +72,15 @@ class TestPDFGenerator:
         assert PDFGenerator._format_date("present") == "Present"
         assert PDFGenerator._format_date("Present") == "Present"
         assert PDFGenerator._format_date("current") == "Present"
+        assert PDFGenerator._format_date("") == "Present"
+
+    def test_format_date_every_month(self):
+        """Month abbreviations come from the fixed English table"""
+        months = [PDFGenerator._format_date(f"2020-{m:02d}-01")[:3] for m in range(1, 13)]
+        assert months == [
+            "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+            "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+        ]
 
     def test_cv_to_html(self):
         """Test CV JSON renders to HTML correctly"""
@@ -126,6 +154,12 @@ class TestPDFGenerator:
         assert metadata["subject"] == "Professional Resume"
         assert metadata["creator"] == "LinkedIn Job Application Agent"
 
+    def test_build_metadata_without_contact(self):
+        """A missing or null contact block falls back to the placeholder name"""
+        generator = PDFGenerator()
+        for cv_json in ({}, {"contact": None}):
+            assert generator._build_metadata(cv_json, None)["author"] == "Unknown"
+
     def test_build_metadata_with_custom(self):
         """Test custom metadata overrides defaults"""
         generator = PDFGenerator()
@@ -141,6 +175,217 @@ class TestPDFGenerator:
         assert metadata["title"] == "Custom Title"
         assert metadata["author"] == "Jane Smith"
 
+    def test_template_compiled_once(self, monkeypatch):
+        """Renders reuse the template compiled in __init__"""
+        generator = PDFGenerator()
+        calls = []
+        original = generator.jinja_env.get_template
+        monkeypatch.setattr(
+            generator.jinja_env, "get_template", lambda name: calls.append(name) or original(name)
+        )
+
+        generator._cv_to_html({"contact": {"full_name": "Jane Smith"}})
+        generator._cv_to_html({"contact": {"full_name": "John Doe"}})
+
+        assert calls == []
+
+    def test_bytecode_cache_written_and_reused(self, tmp_path):
+        """Compiled template bytecode lands in the cache dir and is reused"""
+        cache_dir = tmp_path / "jinja"
+        first = PDFGenerator(bytecode_cache_dir=cache_dir)
+        cached = list(cache_dir.glob("cv_*.cache"))
+        assert len(cached) == 1
+
+        second = PDFGenerator(bytecode_cache_dir=cache_dir)
+        cv = {"contact": {"full_name": "Jane Smith"}}
+        assert second._cv_to_html(cv) == first._cv_to_html(cv)
+        assert list(cache_dir.glob("cv_*.cache")) == cached
+
+    def test_css_text_shared_across_generators(self, tmp_path):
+        """Generators for one template share the stylesheet text until it changes"""
+        theme = tmp_path / "modern"
+        shutil.copytree(Path("src/templates/cv/modern"), theme)
+
+        first = PDFGenerator(template_dir=tmp_path)
+        second = PDFGenerator(template_dir=tmp_path)
+        assert second._load_css() is first._load_css()
+
+        css_path = theme / "style.css"
+        css_path.write_text("body { color: red; }", encoding="utf-8")
+        stat = css_path.stat()
+        os.utime(css_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert first._load_css() == "body { color: red; }"
+
+    def test_font_config_and_lock_per_generator(self, monkeypatch):
+        """Each generator owns its FontConfiguration and render lock"""
+        fonts = pytest.importorskip("weasyprint.text.fonts")
+        monkeypatch.setattr(fonts, "FontConfiguration", object)
+        first = PDFGenerator()
+        second = PDFGenerator(template_name="compact")
+        assert first.font_config is first.font_config
+        assert first.font_config is not second.font_config
+        assert first._render_lock is not second._render_lock
+
+        given = object()
+        assert PDFGenerator(font_config=given).font_config is given
+
+    def test_render_html_embeds_css_and_escapes_title(self):
+        """Standalone preview wraps body and stylesheet; the name is escaped"""
+        generator = PDFGenerator()
+        cv = {"contact": {"full_name": "Jane <b>Smith</b>"}}
+
+        html = generator.render_html(cv)
+
+        assert html.startswith("<!DOCTYPE html>")
+        assert "<title>Jane &lt;b&gt;Smith&lt;/b&gt; - Resume</title>" in html
+        assert generator._load_css() in html
+        assert generator._cv_to_html(cv) in html
+
+    def test_render_html_memoized_per_cv(self, monkeypatch):
+        """Repeat previews of the same CV skip the template render"""
+        generator = PDFGenerator()
+        calls = []
+        original = generator._cv_to_html
+        monkeypatch.setattr(generator, "_cv_to_html", lambda cv: calls.append(cv) or original(cv))
+
+        first = generator.render_html({"contact": {"full_name": "Jane", "email": "j@x"}})
+        again = generator.render_html({"contact": {"email": "j@x", "full_name": "Jane"}})
+        other = generator.render_html({"contact": {"full_name": "John"}})
+
+        assert again == first
+        assert "John" in other
+        assert len(calls) == 2
+
+        reloading = PDFGenerator(auto_reload=True)
+        reloading.render_html({"contact": {"full_name": "Jane"}})
+        assert reloading._html_cache == {}
+
+    def test_html_preview_does_not_load_weasyprint(self, monkeypatch):
+        """Constructing a generator and rendering HTML never imports WeasyPrint"""
+        for name in ("weasyprint", "weasyprint.text.fonts"):
+            monkeypatch.setitem(sys.modules, name, None)  # any import now fails
+
+        generator = PDFGenerator()
+        assert "Jane" in generator.render_html({"contact": {"full_name": "Jane"}})
+
+    def test_stylesheet_parsed_once(self, monkeypatch):
+        """The CSS object is built on first use and then reused"""
+        built = []
+        monkeypatch.setattr(
+            "weasyprint.CSS", lambda **kwargs: built.append(kwargs) or object()
+        )
+        generator = PDFGenerator()
+        assert built == []
+
+        first = generator._get_css()
+        assert generator._get_css() is first
+        assert len(built) == 1
+        assert built[0]["font_config"] is generator.font_config
+        assert built[0]["base_url"] == str(Path("src/templates/cv") / generator.template_name)
+
+    def test_stylesheet_reparsed_after_edit(self, tmp_path, monkeypatch):
+        """An edited style.css is parsed again instead of serving the old CSS"""
+        monkeypatch.setattr("weasyprint.CSS", lambda **kwargs: kwargs["string"])
+        theme = tmp_path / "modern"
+        shutil.copytree(Path("src/templates/cv/modern"), theme)
+        generator = PDFGenerator(template_dir=tmp_path)
+        original = generator._get_css()
+
+        css_path = theme / "style.css"
+        css_path.write_text("body { color: red; }", encoding="utf-8")
+        stat = css_path.stat()
+        os.utime(css_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert original != "body { color: red; }"
+        assert generator._get_css() == "body { color: red; }"
+
+    @pytest.mark.parametrize("payload", [b"%PDF-1.7", b""])
+    def test_generate_pdf_writes_through_file_handle(self, tmp_path, monkeypatch, payload):
+        """write_pdf streams into our handle; empty output is an error"""
+        from unittest.mock import MagicMock
+
+        document = MagicMock()
+        document.write_pdf.side_effect = lambda target: target.write(payload)
+        html = MagicMock()
+        html.render.return_value = document
+        monkeypatch.setattr("weasyprint.HTML", lambda **kwargs: html)
+        monkeypatch.setattr("weasyprint.CSS", lambda **kwargs: object())
+        output_path = tmp_path / "cv.pdf"
+
+        generator = PDFGenerator()
+        cv_json = {"contact": {"full_name": "Jane Smith"}}
+        if payload:
+            assert generator.generate_pdf(cv_json, output_path) == str(output_path.absolute())
+            assert output_path.read_bytes() == payload
+        else:
+            with pytest.raises(OSError, match="wrote no data"):
+                generator.generate_pdf(cv_json, output_path)
+            assert not output_path.exists()
+
+        html.render.side_effect = RuntimeError("layout failed")
+        with pytest.raises(OSError, match="layout failed"):
+            generator.generate_pdf(cv_json, tmp_path / "broken.pdf")
+        assert not (tmp_path / "broken.pdf").exists()
+        assert [p.name for p in tmp_path.iterdir()] == (["cv.pdf"] if payload else [])
+
+    def test_failed_rerender_keeps_previous_pdf(self, tmp_path, monkeypatch):
+        """The old PDF survives a failed re-render; no temp file is left over"""
+        from unittest.mock import MagicMock
+
+        document = MagicMock()
+        html = MagicMock()
+        html.render.return_value = document
+        monkeypatch.setattr("weasyprint.HTML", lambda **kwargs: html)
+        monkeypatch.setattr("weasyprint.CSS", lambda **kwargs: object())
+        output_path = tmp_path / "cv.pdf"
+        output_path.write_bytes(b"%PDF-old")
+        generator = PDFGenerator()
+        cv_json = {"contact": {"full_name": "Jane Smith"}}
+
+        html.render.side_effect = RuntimeError("layout failed")
+        with pytest.raises(OSError, match="layout failed"):
+            generator.generate_pdf(cv_json, output_path)
+
+        html.render.side_effect = None
+        document.write_pdf.side_effect = lambda target: target.write(b"")
+        with pytest.raises(OSError, match="wrote no data"):
+            generator.generate_pdf(cv_json, output_path)
+
+        assert output_path.read_bytes() == b"%PDF-old"
+        assert [p.name for p in tmp_path.iterdir()] == ["cv.pdf"]
+
+        document.write_pdf.side_effect = lambda target: target.write(b"%PDF-new")
+        generator.generate_pdf(cv_json, output_path)
+        assert output_path.read_bytes() == b"%PDF-new"
+        assert [p.name for p in tmp_path.iterdir()] == ["cv.pdf"]
+
+    @pytest.mark.parametrize("payload", [b"%PDF-1.7", b""])
+    def test_generate_pdf_bytes(self, monkeypatch, payload):
+        """In-memory rendering returns the PDF bytes; empty output is an error"""
+        from unittest.mock import MagicMock
+
+        document = MagicMock()
+        document.write_pdf.side_effect = lambda target: target.write(payload)
+        html = MagicMock()
+        html.render.return_value = document
+        monkeypatch.setattr("weasyprint.HTML", lambda **kwargs: html)
+        monkeypatch.setattr("weasyprint.CSS", lambda **kwargs: object())
+
+        generator = PDFGenerator()
+        cv_json = {"contact": {"full_name": "Jane Smith"}}
+        if payload:
+            assert generator.generate_pdf_bytes(cv_json) == payload
+            assert document.metadata.author == "Jane Smith"
+        else:
+            with pytest.raises(OSError, match="wrote no data"):
+                generator.generate_pdf_bytes(cv_json)
+
+    def test_get_pdf_generator_shared_per_template(self):
+        """The factory hands out one generator per template"""
+        first = get_pdf_generator("src/templates/cv", "compact")
+        assert get_pdf_generator("src/templates/cv", "compact") is first
+        assert get_pdf_generator("src/templates/cv", "modern") is not first
+
     @requires_weasyprint_libs
     def test_generate_pdf_creates_output_directory(self, tmp_path, sample_cv_json):
         """Test PDF generation creates output directory if it doesn't exist"""
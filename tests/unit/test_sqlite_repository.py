@@ -4,16 +4,19 @@ Tests all methods of the SQLite-backed job repository implementation.
 Uses temporary database files for isolation.
 """
 
-from datetime import datetime, timedelta
+import sqlite3
+from datetime import datetime, timedelta, timezone
 
 import pytest
 import pytest_asyncio
 
+from src.models.state_machine import BusinessState
 from src.models.unified import JobRecord
 from src.services.db.job_repository import (
     RepositoryError,
     SQLiteJobRepository,
 )
+from src.services.db.repository import decode_cursor, next_cursor
 
 TEST_USER_ID = "user-test-123"
 
@@ -56,6 +59,16 @@ async def test_initialize_creates_parent_directories(tmp_path):
     await repo.close()
 
 
+@pytest.mark.asyncio
+async def test_initialize_enables_wal(temp_db):
+    """WAL is persisted in the file, so every later connection inherits it."""
+    raw = sqlite3.connect(temp_db.db_path)
+    try:
+        assert raw.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        raw.close()
+
+
 @pytest.mark.asyncio
 async def test_operations_fail_without_initialize(tmp_path):
     """Test that operations fail if initialize() not called."""
@@ -182,6 +195,46 @@ async def test_update_nonexistent_raises_error(temp_db):
     assert "not found" in str(exc.value)
 
 
+@pytest.mark.asyncio
+async def test_update_nonexistent_without_status_raises_error(temp_db):
+    """The no-preselect UPDATE ... RETURNING path still reports a missing job."""
+    with pytest.raises(RepositoryError) as exc:
+        await temp_db.update("nonexistent", {"error_message": "boom"})
+    assert "not found" in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_update_many(temp_db):
+    """Patches apply in order inside one transaction with a shared timestamp."""
+    for job_id in ("bulk-1", "bulk-2"):
+        await temp_db.create(
+            JobRecord(job_id=job_id, user_id=TEST_USER_ID, source="url", mode="full", status="pending")
+        )
+    assert (await temp_db.get("bulk-1")).status == "pending"
+
+    await temp_db.update_many([
+        ("bulk-1", {"status": "approved"}),
+        ("bulk-2", {"error_message": "touched"}),
+        ("bulk-1", {"status": "applying"}),
+    ])
+
+    first, second = await temp_db.get("bulk-1"), await temp_db.get("bulk-2")
+    assert first.status == "applying"
+    assert second.error_message == "touched"
+    assert first.updated_at == second.updated_at
+
+
+@pytest.mark.asyncio
+async def test_update_many_missing_job_rolls_back(temp_db):
+    """A bad patch anywhere in the batch leaves every job untouched."""
+    job = JobRecord(job_id="bulk-3", user_id=TEST_USER_ID, source="url", mode="full", status="pending")
+    await temp_db.create(job)
+
+    with pytest.raises(RepositoryError):
+        await temp_db.update_many([("bulk-3", {"status": "approved"}), ("nonexistent", {})])
+    assert (await temp_db.get("bulk-3")).status == "pending"
+
+
 @pytest.mark.asyncio
 async def test_delete(temp_db):
     """Test deleting a job."""
@@ -316,6 +369,46 @@ async def test_get_all_with_pagination(temp_db):
     assert len(page2) == 5
 
 
+@pytest.mark.asyncio
+async def test_get_all_keyset_pagination(temp_db):
+    """Cursor pages are disjoint, ordered, and tie-break on job_id."""
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(7):
+        # Pairs share a timestamp so the job_id tie-break is exercised.
+        await temp_db.create(JobRecord(
+            job_id=f"job-{i}", user_id=TEST_USER_ID, source="url", mode="full",
+            status="pending", created_at=ts + timedelta(minutes=i // 2),
+        ))
+
+    seen: list[str] = []
+    after = None
+    while True:
+        page = await temp_db.get_all(TEST_USER_ID, limit=3, after=after)
+        if not page:
+            break
+        seen.extend(j.job_id for j in page)
+        after = decode_cursor(next_cursor(page))
+
+    assert seen == [f"job-{i}" for i in (6, 5, 4, 3, 2, 1, 0)]
+
+
+@pytest.mark.asyncio
+async def test_get_by_status_offset(temp_db):
+    """Offset paging works; mixing it with a cursor is rejected."""
+    for i in range(3):
+        await temp_db.create(JobRecord(
+            job_id=f"job-{i}", user_id=TEST_USER_ID, source="url", mode="full", status="pending"
+        ))
+
+    page = await temp_db.get_by_status(TEST_USER_ID, "pending", limit=2, offset=2)
+    assert len(page) == 1
+
+    with pytest.raises(ValueError):
+        await temp_db.get_by_status(
+            TEST_USER_ID, "pending", offset=1, after=(datetime.now(tz=timezone.utc), "x")
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_history(temp_db):
     """Test getting job history for a user."""
@@ -340,6 +433,30 @@ async def test_get_history_with_status_filter(temp_db):
     assert all(j.status in ["applied", "declined"] for j in history)
 
 
+@pytest.mark.asyncio
+async def test_get_history_summaries_matches_history(temp_db):
+    """Summaries carry the same page as get_history with title/company extracted."""
+    for i, status in enumerate(["applied", "declined", "failed", "applied"]):
+        await temp_db.create(JobRecord(
+            job_id=f"j{i}", user_id=TEST_USER_ID, source="url", mode="full", status=status,
+            job_posting={"title": f"Engineer {i}", "company": "Acme", "description": "x" * 1000},
+        ))
+
+    for statuses in (None, ["applied"], ["applied", "declined"]):
+        history = await temp_db.get_history(TEST_USER_ID, limit=2, statuses=statuses)
+        summaries = await temp_db.get_history_summaries(TEST_USER_ID, limit=2, statuses=statuses)
+        assert [s.job_id for s in summaries] == [j.job_id for j in history]
+        assert [s.job_title for s in summaries] == [j.job_posting["title"] for j in history]
+        assert all(s.company == "Acme" for s in summaries)
+
+        rest = await temp_db.get_history_summaries(
+            TEST_USER_ID, statuses=statuses,
+            after=decode_cursor(next_cursor(summaries, order_by="updated_at")),
+        )
+        expected = await temp_db.get_history(TEST_USER_ID, statuses=statuses)
+        assert [s.job_id for s in summaries + rest] == [j.job_id for j in expected]
+
+
 # =============================================================================
 # Specialized Tests
 # =============================================================================
@@ -363,6 +480,27 @@ async def test_find_by_application_url(temp_db):
     assert found.job_id == "url-1"
 
 
+@pytest.mark.asyncio
+async def test_raw_lookups_see_latest_writes(temp_db):
+    """get/find_by_application_url read on their own connection; writes must be visible."""
+    await temp_db.create(JobRecord(
+        job_id="raw-1", user_id=TEST_USER_ID, source="url", mode="full",
+        status="pending", application_url="https://example.com/job/raw",
+        job_posting={"title": "Engineer"},
+    ))
+    await temp_db.update("raw-1", {"status": "approved", "job_posting": {"title": "Lead"}})
+
+    job = await temp_db.get("raw-1")
+    assert job.status == "approved"
+    assert job.job_posting == {"title": "Lead"}
+
+    found = await temp_db.find_by_application_url("https://example.com/job/raw", TEST_USER_ID)
+    assert found.job_id == "raw-1"
+    assert await temp_db.find_by_application_url(
+        "https://example.com/job/raw", "other-user"
+    ) is None
+
+
 @pytest.mark.asyncio
 async def test_find_by_application_url_not_found(temp_db):
     """Test find_by_application_url when URL doesn't exist."""
@@ -454,6 +592,100 @@ async def test_cleanup_validation_empty_statuses(temp_db):
     assert "statuses list cannot be empty" in str(exc.value)
 
 
+@pytest.mark.asyncio
+async def test_status_list_queries_use_composite_index(temp_db):
+    """Filter + ORDER BY is served from the composite index, no temp sort."""
+    raw = sqlite3.connect(temp_db.db_path)
+    try:
+        plan = " ".join(
+            row[3] for row in raw.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM job WHERE user_id = ? AND status = ? "
+                "ORDER BY created_at DESC, job_id DESC LIMIT 20",
+                (TEST_USER_ID, "pending"),
+            )
+        )
+    finally:
+        raw.close()
+
+    assert "idx_job_user_status_created" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_global_status_queries_use_composite_index(temp_db):
+    """Cross-user status filters use the status composites; the bare status index is gone."""
+    raw = sqlite3.connect(temp_db.db_path)
+    try:
+        plan = " ".join(
+            row[3] for row in raw.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM job WHERE status = ? "
+                "ORDER BY updated_at DESC LIMIT 200",
+                ("queued",),
+            )
+        )
+        indexes = {
+            row[0] for row in raw.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='job'"
+            )
+        }
+    finally:
+        raw.close()
+
+    assert "idx_job_status_updated" in plan
+    assert "TEMP B-TREE" not in plan
+    assert {"idx_job_status_created", "idx_job_status_updated"} <= indexes
+    assert "job_status" not in indexes
+
+
+def test_row_to_job_record_matches_validated_model():
+    """The model_construct fast path yields the same record validation would."""
+    repo = SQLiteJobRepository(db_path=":memory:")
+    row = {
+        "job_id": "row-1",
+        "user_id": TEST_USER_ID,
+        "source": "linkedin",
+        "mode": "full",
+        "status": "pending",
+        "job_posting": '{"title": "Engineer"}',
+        "filter_result": None,
+        "session_authenticated": 1,
+        "scrape_attempts": None,
+        "workflow_step": None,
+        "created_at": "2026-01-01 00:00:00",
+        "updated_at": datetime(2026, 1, 2, tzinfo=timezone.utc),
+    }
+
+    record = repo._row_to_job_record(row)
+
+    assert record == JobRecord.model_validate(record.model_dump())
+    assert record.status == BusinessState.PENDING
+    assert record.session_authenticated is True
+    assert record.job_posting == {"title": "Engineer"}
+    assert record.created_at.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_two_repositories_coexist(tmp_path):
+    """Each repository binds its own table subclass; neither sees the other's rows."""
+    repo_a = SQLiteJobRepository(db_path=str(tmp_path / "a.db"))
+    repo_b = SQLiteJobRepository(db_path=str(tmp_path / "b.db"))
+    await repo_a.initialize()
+    await repo_b.initialize()
+    try:
+        await repo_a.create(JobRecord(
+            job_id="only-a", user_id=TEST_USER_ID, source="url", mode="full", status="pending"
+        ))
+        await repo_b.create(JobRecord(
+            job_id="only-b", user_id=TEST_USER_ID, source="url", mode="full", status="pending"
+        ))
+
+        assert [j.job_id for j in await repo_a.get_all(TEST_USER_ID)] == ["only-a"]
+        assert [j.job_id for j in await repo_b.get_all(TEST_USER_ID)] == ["only-b"]
+    finally:
+        await repo_a.close()
+        await repo_b.close()
+
+
 # =============================================================================
 # Persistence Tests
 # =============================================================================